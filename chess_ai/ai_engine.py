@@ -5,15 +5,76 @@ This module implements a chess AI using minimax with alpha-beta pruning
 for move selection and evaluation.
 """
 
+import os
 import time
 import random
-from typing import List, Tuple, Optional, Dict, Any
+import threading
+import itertools
+import multiprocessing
+from multiprocessing.pool import Pool
+from queue import Empty, SimpleQueue
+from operator import itemgetter
+from typing import Callable, Iterator, List, Tuple, Optional, Dict, Any
+
+import numpy as np
 
 from .state_manager import ChessState, PieceType, PieceColor
-from .move_generator import MoveGenerator
+from .move_generator import MoveGenerator, SQUARE_COORDS
 from .evaluation import PositionEvaluator
 
 
+# Transposition table entry flags
+TT_EXACT = 0  # Value is the exact score of the position
+TT_LOWER = 1  # Value is a lower bound (search failed high)
+TT_UPPER = 2  # Value is an upper bound (search failed low)
+
+# The transposition table has 2 ** TT_SIZE_BITS entries, indexed by the low bits
+# of the Zobrist hash. Each entry is a row of four int64 columns:
+# (hash, value, depth << 8 | flag, best move packed as from_square | to_square << 6)
+TT_SIZE_BITS = 20
+
+# Depth reduction (in plies) for the null-move search
+NULL_MOVE_REDUCTION = 2
+
+# Maximum search ply tracked by the killer move table
+MAX_PLY = 64
+
+# Integer score bounds (centipawns); mate scores are MATE minus the distance in plies
+INF = 1_000_000_000
+MATE = 900_000_000
+
+# Scores beyond +-MATE_THRESHOLD are mate scores. The transposition table stores
+# them as the distance from the stored position instead of from the root
+MATE_THRESHOLD = MATE - 10_000
+
+# Assumed ratio between the durations of consecutive iterative-deepening
+# iterations, until two iterations have been timed
+DEFAULT_BRANCHING_FACTOR = 5.0
+
+# Minimum iteration depth at which root moves are searched in worker processes
+# (shallower iterations finish faster than the work can be shipped to the pool)
+PARALLEL_MIN_DEPTH = 4
+
+# Seconds between checks of the time limit and stop_event while waiting for
+# the worker processes' results
+PARALLEL_POLL_INTERVAL = 0.05
+
+# Number of parallel root searches that can be running at once across all
+# engines sharing a pool (each needs a slot in the pool's shared search table)
+PARALLEL_SEARCH_SLOTS = 64
+
+# Nodes searched between checks whether a worker's search has been called off
+ABORT_CHECK_INTERVAL = 1024
+
+# Worker processes are started fresh rather than forked, since the pool is
+# created from whichever (possibly multithreaded) search thread needs it first
+POOL_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+class _SearchAborted(Exception):
+    """Raised inside a worker process when its search has been called off."""
+
+
 class ChessAI:
     """
     Chess AI engine that selects moves using minimax with alpha-beta pruning.
@@ -35,7 +96,37 @@ class ChessAI:
         self.difficulty = difficulty
         self.time_limit = 5.0  # Default time limit in seconds
         self.nodes_searched = 0
-        self.transposition_table: Dict[str, Dict[str, Any]] = {}  # Position cache
+        
+        # Can be set from another thread to end a running search early, as if
+        # its time had run out; it stays set until cleared by the caller
+        self.stop_event = threading.Event()
+        
+        # Fixed-size transposition table (see TT_SIZE_BITS for the entry layout)
+        self.tt = np.zeros((1 << TT_SIZE_BITS, 4), dtype=np.int64)
+        self.tt_mask = (1 << TT_SIZE_BITS) - 1
+        
+        # Move ordering heuristics for quiet moves, reset for every search:
+        # the last two quiet moves that caused a beta cutoff at each ply, and
+        # a history score per (piece index, target square) for such cutoffs
+        self.killers: List[List[Optional[Tuple[Tuple[int, int], Tuple[int, int]]]]] = [
+            [None, None] for _ in range(MAX_PLY)
+        ]
+        self.history: Dict[Tuple[int, int], int] = {}
+        
+        # Worker processes for searching root moves in parallel (created on first use).
+        # Engines created with spawn() use the pool of the engine that owns it
+        self.search_workers = os.cpu_count() or 1
+        self._pool: Optional[Pool] = None
+        self._pool_owner: 'ChessAI' = self
+        self._pool_lock = threading.Lock()
+        
+        # Id of the parallel search running in each slot (0 if none), shared with
+        # the workers so that they can give up on moves of a finished search
+        self._search_ids = itertools.count(1)
+        self._running_searches = None
+        
+        # Checked every ABORT_CHECK_INTERVAL nodes, if set; returns True to abort the search
+        self._abort_check: Optional[Callable[[], bool]] = None
         
     def _get_depth_for_difficulty(self, difficulty: int) -> int:
         """
@@ -77,6 +168,25 @@ class ChessAI:
         """
         self.time_limit = seconds
     
+    def spawn(self) -> 'ChessAI':
+        """
+        Create an engine that can search at the same time as this one.
+        
+        The new engine has the same settings and shares this engine's
+        transposition table and worker processes, but has its own per-search
+        state (killer moves, history, node count), so the two can be used
+        from different threads concurrently.
+        
+        Returns:
+            The new engine
+        """
+        engine = ChessAI(self.difficulty)
+        engine.time_limit = self.time_limit
+        engine.search_workers = self.search_workers
+        engine.tt = self.tt
+        engine._pool_owner = self._pool_owner
+        return engine
+    
     def get_best_move(self, state: ChessState) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """
         Find the best move for the current player.
@@ -87,9 +197,11 @@ class ChessAI:
         Returns:
             Best move as ((from_x, from_y), (to_x, to_y)) tuple, or None if no legal moves
         """
-        # Reset search statistics
+        # Reset search statistics and move ordering heuristics
         self.nodes_searched = 0
         start_time = time.time()
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.history = {}
         
         # Get all legal moves
         legal_moves = self.move_generator.generate_moves(state)
@@ -107,46 +219,74 @@ class ChessAI:
         
         # Use iterative deepening to better manage time
         best_move = None
-        best_value = float('-inf') if state.active_color == PieceColor.WHITE else float('inf')
+        
+        # Scores are from the point of view of the side to move (negamax)
+        color = 1 if state.active_color == PieceColor.WHITE else -1
+        
+        # Weaker levels get a small random tiebreak on the root move scores for variety
+        add_noise = self.difficulty <= 2
+        
+        # Local names for the functions used in the root move loop
+        negamax = self._negamax
+        make_move = state.make_move
+        unmake_move = state.unmake_move
+        
+        # Order the root moves once; later iterations only promote the previous best move
+        ordered_moves = list(self._order_moves(legal_moves, state))
+        
+        # Durations of the last two completed iterations, to predict the next one
+        last_iteration_time = 0.0
+        branching_factor = DEFAULT_BRANCHING_FACTOR
         
         # Start with depth 1 and increase up to max_depth
         for current_depth in range(1, self.max_depth + 1):
-            # Order moves using move ordering from previous iteration
-            ordered_moves = self._order_moves(legal_moves, state)
+            # Only start an iteration that is likely to finish within the time limit
+            iteration_start = time.time()
+            elapsed_time = iteration_start - start_time
+            if current_depth > 1 and (elapsed_time + last_iteration_time * branching_factor > self.time_limit or
+                                      self.stop_event.is_set()):
+                break
             
-            alpha = float('-inf')
-            beta = float('inf')
+            # Search the best move from the previous iteration first
+            if best_move is not None:
+                ordered_moves = [best_move] + [move for move in ordered_moves if move != best_move]
             
-            # White is maximizing player, black is minimizing
-            if state.active_color == PieceColor.WHITE:
-                best_value = float('-inf')
+            if self._use_parallel_search(current_depth):
+                best_move, best_value = self._search_root_parallel(state, ordered_moves, current_depth, color,
+                                                                   start_time + self.time_limit)
+            else:
+                alpha = -INF
+                beta = INF
+                best_value = -INF
+                
                 for move in ordered_moves:
-                    # Make a copy of the state to avoid modifying the original
-                    new_state = self._make_move_copy(state, move)
+                    # Search the move on the board itself and take it back afterwards
+                    (from_x, from_y), (to_x, to_y) = move
+                    undo = make_move(from_x, from_y, to_x, to_y)
+                    value = -negamax(state, current_depth - 1, -beta, -alpha, -color, 1)
+                    unmake_move(from_x, from_y, to_x, to_y, undo)
+                    if add_noise:
+                        value += random.randint(-5, 5)
                     
-                    value = self._alpha_beta(new_state, current_depth - 1, alpha, beta, False)
-                    
-                    if value > best_value:
+                    if best_move is None or value > best_value:
                         best_value = value
                         best_move = move
                     
                     alpha = max(alpha, best_value)
-            else:
-                best_value = float('inf')
-                for move in ordered_moves:
-                    new_state = self._make_move_copy(state, move)
-                    
-                    value = self._alpha_beta(new_state, current_depth - 1, alpha, beta, True)
-                    
-                    if value < best_value:
-                        best_value = value
-                        best_move = move
                     
-                    beta = min(beta, best_value)
+                    # Out of time: stop mid-iteration. The previous best move was
+                    # searched first, so best_move is either that move or one that
+                    # scored better at this depth - never a worse choice
+                    if time.time() - start_time > self.time_limit or self.stop_event.is_set():
+                        break
+            
+            # Estimate how much longer the next iteration will take
+            iteration_time = time.time() - iteration_start
+            if last_iteration_time > 0.01:
+                branching_factor = iteration_time / last_iteration_time
+            last_iteration_time = iteration_time
             
-            # Check if time limit is approaching
-            elapsed_time = time.time() - start_time
-            if elapsed_time > self.time_limit * 0.8:  # Use 80% of time limit as cutoff
+            if time.time() - start_time > self.time_limit:
                 break
         
         # Add some randomness to weaker difficulty levels to make the AI less predictable
@@ -157,487 +297,497 @@ class ChessAI:
         
         return best_move
     
-    def _alpha_beta(self, state: ChessState, depth: int, alpha: float, beta: float, 
-                   maximizing_player: bool) -> float:
+    def _use_parallel_search(self, depth: int) -> bool:
         """
-        Perform alpha-beta pruning search to evaluate positions.
+        Decide whether an iteration's root moves should be searched in worker processes.
         
         Args:
-            state: Current chess state
-            depth: Remaining search depth
-            alpha: Alpha value for pruning
-            beta: Beta value for pruning
-            maximizing_player: True if current player is maximizing (white)
+            depth: Depth of the iteration
             
         Returns:
-            Position score
+            True to use the process pool, False to search in this process
         """
-        # Increment node counter
-        self.nodes_searched += 1
-        
-        # Check for terminal conditions
-        if depth == 0 or state.is_checkmate() or state.is_stalemate():
-            return self._evaluate_position(state)
-        
-        legal_moves = self.move_generator.generate_moves(state)
-        
-        # No legal moves - checkmate or stalemate
-        if not legal_moves:
-            if state.is_check():  # Checkmate
-                return float('-inf') if maximizing_player else float('inf')
-            else:  # Stalemate
-                return 0
-        
-        # Order moves for better pruning
-        ordered_moves = self._order_moves(legal_moves, state)
-        
-        if maximizing_player:
-            value = float('-inf')
-            for move in ordered_moves:
-                new_state = self._make_move_copy(state, move)
-                value = max(value, self._alpha_beta(new_state, depth - 1, alpha, beta, False))
-                alpha = max(alpha, value)
-                if alpha >= beta:
-                    break  # Beta cutoff
-            return value
-        else:
-            value = float('inf')
-            for move in ordered_moves:
-                new_state = self._make_move_copy(state, move)
-                value = min(value, self._alpha_beta(new_state, depth - 1, alpha, beta, True))
-                beta = min(beta, value)
-                if beta <= alpha:
-                    break  # Alpha cutoff
-            return value
+        return self.search_workers > 1 and self.difficulty >= 3 and depth >= PARALLEL_MIN_DEPTH
     
-    def _make_move_copy(self, state: ChessState, move: Tuple[Tuple[int, int], Tuple[int, int]]) -> ChessState:
+    def _search_root_parallel(self, state: ChessState,
+                              ordered_moves: List[Tuple[Tuple[int, int], Tuple[int, int]]],
+                              depth: int, color: int,
+                              deadline: float) -> Tuple[Tuple[Tuple[int, int], Tuple[int, int]], int]:
         """
-        Create a new state with the move applied.
+        Search the root moves of one iteration across the worker process pool.
         
-        Args:
-            state: Original chess state
-            move: Move to apply as ((from_x, from_y), (to_x, to_y))
-            
-        Returns:
-            New chess state with the move applied
-        """
-        # This is a simplified implementation
-        # A more complete version would handle special moves properly
-        from_pos, to_pos = move
-        from_x, from_y = from_pos
-        to_x, to_y = to_pos
-        
-        # Create a deep copy of the state
-        new_state = ChessState()
-        new_state.board = state.board.copy()
-        new_state.active_color = state.active_color
-        new_state.castling_rights = {
-            color: rights[:] for color, rights in state.castling_rights.items()
-        }
-        new_state.en_passant_target = state.en_passant_target
-        new_state.halfmove_clock = state.halfmove_clock
-        new_state.fullmove_number = state.fullmove_number
-        new_state.move_history = state.move_history.copy()
+        The first (expected best) move is searched here with the full window;
+        the best score so far then serves as the lower bound for the remaining
+        moves, which are searched in parallel. Each worker keeps its own
+        transposition table between searches.
         
-        # Apply the move
-        new_state.make_move(from_x, from_y, to_x, to_y)
-        
-        return new_state
-    
-    def _order_moves(self, moves: List[Tuple[Tuple[int, int], Tuple[int, int]]], 
-                    state: ChessState) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
-        """
-        Order moves to optimize alpha-beta pruning.
+        Once the deadline passes or stop_event is set, the best completed move
+        is returned, and the workers still searching other moves give up.
         
         Args:
-            moves: List of legal moves
             state: Current chess state
+            ordered_moves: Root moves, expected best first
+            depth: Depth of the iteration
+            color: 1 if white is to move, -1 if black is to move
+            deadline: time.time() value at which the search must stop
             
         Returns:
-            Ordered list of moves (best moves first)
-        """
-        # This is a simple move ordering:
-        # 1. Captures - sorted by value of captured piece - value of capturing piece
-        # 2. Checks
-        # 3. Other moves
-        
-        # For simplicity, we'll just prioritize captures for now
-        move_scores = []
-        
-        for move in moves:
-            from_pos, to_pos = move
-            from_x, from_y = from_pos
-            to_x, to_y = to_pos
-            
-            score = 0
-            
-            # Get moving piece
-            moving_piece = state.get_piece_at(from_x, from_y)
-            if moving_piece is None:
-                continue
-                
-            # Check if capture (piece at target square)
-            target_piece = state.get_piece_at(to_x, to_y)
-            if target_piece is not None:
-                # MVV-LVA (Most Valuable Victim - Least Valuable Aggressor)
-                # Score captures higher based on value of captured piece minus value of capturing piece
-                moving_value = self.evaluator.piece_values[moving_piece.piece_type]
-                target_value = self.evaluator.piece_values[target_piece.piece_type]
-                score = target_value - (moving_value // 10)
-            
-            # Add positional improvement score
-            # Higher scores for moves to better squares according to piece-square tables
-            current_sq_value = self.evaluator.piece_square_tables[moving_piece.piece_type][from_y][from_x]
-            new_sq_value = self.evaluator.piece_square_tables[moving_piece.piece_type][to_y][to_x]
-            positional_improvement = new_sq_value - current_sq_value
-            
-            score += positional_improvement // 10
+            Tuple of (best move, its score)
+        """
+        best_move = ordered_moves[0]
+        (from_x, from_y), (to_x, to_y) = best_move
+        undo = state.make_move(from_x, from_y, to_x, to_y)
+        best_value = -self._negamax(state, depth - 1, -INF, INF, -color, 1)
+        state.unmake_move(from_x, from_y, to_x, to_y, undo)
+        
+        pool = self._get_pool()
+        owner = self._pool_owner
+        with owner._pool_lock:
+            search_id = next(owner._search_ids)
+        slot = search_id % PARALLEL_SEARCH_SLOTS
+        running_searches = owner._running_searches
+        running_searches[slot] = search_id
+        
+        results: SimpleQueue = SimpleQueue()
+        remaining = iter(ordered_moves[1:])
+        pending = 0
+        try:
+            while True:
+                # Hand out moves only as workers free up, so that a stopped search
+                # leaves no queued work behind in the (shared) pool
+                while pending < self.search_workers:
+                    move = next(remaining, None)
+                    if move is None:
+                        break
+                    task = (state, move, depth, best_value, color, search_id)
+                    pool.apply_async(_search_root_move, (task,),
+                                     callback=results.put, error_callback=results.put)
+                    pending += 1
+                if not pending:
+                    break
+                    
+                try:
+                    result = results.get(timeout=PARALLEL_POLL_INTERVAL)
+                except Empty:
+                    result = None
+                if result is not None:
+                    pending -= 1
+                    if isinstance(result, BaseException):
+                        raise result
+                    move, value, nodes = result
+                    self.nodes_searched += nodes
+                    if value > best_value:
+                        best_value = value
+                        best_move = move
+                        
+                if time.time() > deadline or self.stop_event.is_set():
+                    break
+        finally:
+            # Workers still searching this iteration's moves see this and give up
+            running_searches[slot] = 0
             
-            move_scores.append((move, score))
-        
-        # Sort by score, highest first
-        move_scores.sort(key=lambda x: x[1], reverse=True)
-        
-        # Extract just the moves from the sorted list
-        return [move for move, _ in move_scores]
+        return best_move, best_value
     
-    def _evaluate_position(self, state: ChessState) -> float:
+    def _get_pool(self) -> Pool:
         """
-        Evaluate the current chess position.
+        Get the worker process pool for parallel search, starting it on first use.
         
-        Args:
-            state: The chess state to evaluate
-            
         Returns:
-            Position score (positive favors white, negative favors black)
-        """
-        # Use the PositionEvaluator to get a score
-        score = self.evaluator.evaluate(state)
-        
-        # Add a small random factor to prevent repetition and add variety
-        noise = random.uniform(-5, 5)
-        score += noise
-        
-        return score
+            The pool of the engine that owns it (see spawn)
+        """
+        owner = self._pool_owner
+        with owner._pool_lock:
+            if owner._pool is None:
+                context = multiprocessing.get_context(POOL_START_METHOD)
+                if owner._running_searches is None:
+                    owner._running_searches = context.RawArray('q', PARALLEL_SEARCH_SLOTS)
+                owner._pool = context.Pool(owner.search_workers, initializer=_init_worker,
+                                           initargs=(owner._running_searches,))
+            return owner._pool
     
-    def get_statistics(self) -> Dict[str, Any]:
-        """
-        Get statistics about the last search.
-        
-        Returns:
-            Dictionary with search statistics
-        """
-        return {
-            "nodes_searched": self.nodes_searched,
-            "max_depth": self.max_depth,
-            "difficulty": self.difficulty,
-            "time_limit": self.time_limit
-        }
-
-"""
-Chess AI engine module.
-
-This module implements a chess AI using minimax with alpha-beta pruning
-for move selection and evaluation.
-"""
-
-import time
-import random
-from typing import List, Tuple, Optional, Dict, Any
-
-from .state_manager import ChessState, PieceType, PieceColor
-from .move_generator import MoveGenerator
-from .evaluation import PositionEvaluator
-
-
-class ChessAI:
-    """
-    Chess AI engine that selects moves using minimax with alpha-beta pruning.
-    
-    This class implements the core AI decision-making for chess, using position
-    evaluation and search algorithms to find strong moves.
-    """
+    def close(self) -> None:
+        """Shut down the worker processes used for parallel search, if any."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool.join()
+                self._pool = None
     
-    def __init__(self, difficulty: int = 3):
+    def _negamax(self, state: ChessState, depth: int, alpha: int, beta: int, color: int,
+                 ply: int = 0, allow_null: bool = True) -> int:
         """
-        Initialize the chess AI with the specified difficulty.
+        Perform a fail-soft negamax alpha-beta search to evaluate positions.
         
-        Args:
-            difficulty: Difficulty level (1-5), affects search depth and evaluation
-        """
-        self.move_generator = MoveGenerator()
-        self.evaluator = PositionEvaluator()
-        self.max_depth = self._get_depth_for_difficulty(difficulty)
-        self.difficulty = difficulty
-        self.time_limit = 5.0  # Default time limit in seconds
-        self.nodes_searched = 0
-        self.transposition_table: Dict[str, Dict[str, Any]] = {}  # Position cache
-        
-    def _get_depth_for_difficulty(self, difficulty: int) -> int:
-        """
-        Convert difficulty level to search depth.
-        
-        Args:
-            difficulty: Difficulty level (1-5)
-            
-        Returns:
-            Maximum search depth for the given difficulty
-        """
-        # Map difficulty levels to search depths
-        difficulty_depth_map = {
-            1: 2,  # Beginner: 2-ply search
-            2: 3,  # Easy: 3-ply search
-            3: 4,  # Medium: 4-ply search
-            4: 5,  # Hard: 5-ply search
-            5: 6   # Expert: 6-ply search
-        }
-        
-        return difficulty_depth_map.get(difficulty, 4)  # Default to medium
-    
-    def set_difficulty(self, difficulty: int) -> None:
-        """
-        Set the AI difficulty level.
-        
-        Args:
-            difficulty: Difficulty level (1-5)
-        """
-        self.difficulty = difficulty
-        self.max_depth = self._get_depth_for_difficulty(difficulty)
-    
-    def set_time_limit(self, seconds: float) -> None:
-        """
-        Set the time limit for move calculation.
-        
-        Args:
-            seconds: Time limit in seconds
-        """
-        self.time_limit = seconds
-    
-    def get_best_move(self, state: ChessState) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
-        """
-        Find the best move for the current player.
+        Uses null-move pruning and principal variation search (PVS).
         
         Args:
             state: Current chess state
+            depth: Remaining search depth
+            alpha: Alpha value for pruning
+            beta: Beta value for pruning
+            color: 1 if white is to move, -1 if black is to move
+            ply: Distance from the root of the search
+            allow_null: Whether a null move may be tried at this node
             
         Returns:
-            Best move as ((from_x, from_y), (to_x, to_y)) tuple, or None if no legal moves
+            Position score from the point of view of the side to move
         """
-        # Reset search statistics
-        self.nodes_searched = 0
-        start_time = time.time()
+        # Increment node counter
+        self.nodes_searched += 1
+        if (self._abort_check is not None and not self.nodes_searched % ABORT_CHECK_INTERVAL and
+                self._abort_check()):
+            raise _SearchAborted
+        
+        # Probe the transposition table for a previous search of this position
+        tt_move = None
+        key = state.zobrist
+        entry_key, entry_value, entry_depth_flag, entry_move = self.tt[key & self.tt_mask].tolist()
+        if entry_key == key:
+            if entry_move:
+                tt_move = (SQUARE_COORDS[entry_move & 63], SQUARE_COORDS[entry_move >> 6])
+            if entry_depth_flag >> 8 >= depth:
+                # Mate scores are stored relative to the position; make them relative to the root
+                if entry_value > MATE_THRESHOLD:
+                    entry_value -= ply
+                elif entry_value < -MATE_THRESHOLD:
+                    entry_value += ply
+                entry_flag = entry_depth_flag & 0xFF
+                if entry_flag == TT_EXACT:
+                    return entry_value
+                elif entry_flag == TT_LOWER:
+                    alpha = max(alpha, entry_value)
+                else:
+                    beta = min(beta, entry_value)
+                if alpha >= beta:
+                    return entry_value
+        
+        # At the horizon, resolve pending captures instead of evaluating a noisy position
+        # (checkmate and stalemate are detected below from the empty move list)
+        if depth == 0:
+            return self._quiescence(state, alpha, beta, color)
+        
+        in_check = self.move_generator.is_in_check(state)
+        
+        # Null-move pruning: if passing still fails high, a real move will too.
+        # Skipped in check and without pieces (where zugzwang is likely)
+        if (allow_null and depth >= 3 and not in_check and
+                state.has_non_pawn_material(state.active_color)):
+            null_undo = state.push_null()
+            score = -self._negamax(state, depth - 1 - NULL_MOVE_REDUCTION, -beta, -beta + 1,
+                                   -color, ply + 1, allow_null=False)
+            state.pop_null(null_undo)
+            if score >= beta:
+                return score
         
-        # Get all legal moves
         legal_moves = self.move_generator.generate_moves(state)
         
+        # No legal moves - checkmate or stalemate
         if not legal_moves:
-            return None
-        
-        # If only one legal move, return it immediately
-        if len(legal_moves) == 1:
-            return legal_moves[0]
+            if in_check:  # Checkmate (prefer the quickest mate / slowest loss)
+                return -MATE + ply
+            else:  # Stalemate
+                return 0
         
-        # For very low difficulty, just return a random move
-        if self.difficulty == 1 and random.random() < 0.3:
-            return random.choice(legal_moves)
+        # Order moves for better pruning, trying the cached best move first
+        ordered_moves = self._order_moves(legal_moves, state, tt_move, ply)
         
-        # Use iterative deepening to better manage time
+        # Remember the search window to classify the result for the table
+        alpha_orig = alpha
         best_move = None
-        best_value = float('-inf') if state.active_color == PieceColor.WHITE else float('inf')
-        
-        # Start with depth 1 and increase up to max_depth
-        for current_depth in range(1, self.max_depth + 1):
-            # Order moves using move ordering from previous iteration
-            ordered_moves = self._order_moves(legal_moves, state)
-            
-            alpha = float('-inf')
-            beta = float('inf')
-            
-            # White is maximizing player, black is minimizing
-            if state.active_color == PieceColor.WHITE:
-                best_value = float('-inf')
-                for move in ordered_moves:
-                    # Make a copy of the state to avoid modifying the original
-                    new_state = self._make_move_copy(state, move)
-                    
-                    value = self._alpha_beta(new_state, current_depth - 1, alpha, beta, False)
-                    
-                    if value > best_value:
-                        best_value = value
-                        best_move = move
-                    
-                    alpha = max(alpha, best_value)
+        value = -INF
+        
+        # Local names for everything used in the move loop (cheaper than attribute lookups)
+        negamax = self._negamax
+        quiescence = self._quiescence
+        make_move = state.make_move
+        unmake_move = state.unmake_move
+        child_depth = depth - 1
+        child_ply = ply + 1
+        
+        # Children of frontier nodes go straight to the quiescence search,
+        # skipping a negamax call (and its table probe) for every leaf.
+        # Their static evaluations are computed together in one vectorized call
+        frontier = child_depth == 0
+        if frontier:
+            ordered_moves = list(ordered_moves)
+            leaf_scores = self.evaluator.evaluate_batch(self._child_boards(state, ordered_moves)).tolist()
+        
+        for i, move in enumerate(ordered_moves):
+            (from_x, from_y), (to_x, to_y) = move
+            undo = make_move(from_x, from_y, to_x, to_y)
+            if frontier:
+                score = -quiescence(state, -beta, -alpha, -color, -color * leaf_scores[i])
+            elif best_move is None:
+                # Principal variation: search with the full window
+                score = -negamax(state, child_depth, -beta, -alpha, -color, child_ply)
             else:
-                best_value = float('inf')
-                for move in ordered_moves:
-                    new_state = self._make_move_copy(state, move)
-                    
-                    value = self._alpha_beta(new_state, current_depth - 1, alpha, beta, True)
-                    
-                    if value < best_value:
-                        best_value = value
-                        best_move = move
-                    
-                    beta = min(beta, best_value)
+                # Try to prove the move is no better with a zero window,
+                # re-searching with the full window if that fails
+                score = -negamax(state, child_depth, -alpha - 1, -alpha, -color, child_ply)
+                if alpha < score < beta:
+                    score = -negamax(state, child_depth, -beta, -score, -color, child_ply)
+            unmake_move(from_x, from_y, to_x, to_y, undo)
             
-            # Check if time limit is approaching
-            elapsed_time = time.time() - start_time
-            if elapsed_time > self.time_limit * 0.8:  # Use 80% of time limit as cutoff
+            if best_move is None or score > value:
+                value = score
+                best_move = move
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                # Beta cutoff - remember quiet moves that refute the opponent's play
+                moved_piece, captured_piece = undo[0], undo[1]
+                if captured_piece is None:
+                    self._record_quiet_cutoff(move, moved_piece.index, depth, ply)
                 break
         
-        # Add some randomness to weaker difficulty levels to make the AI less predictable
-        if self.difficulty <= 2 and random.random() < 0.2:
-            alternative_moves = [move for move in legal_moves if move != best_move]
-            if alternative_moves:
-                best_move = random.choice(alternative_moves)
+        self._store_transposition(key, depth, value, alpha_orig, beta, best_move, ply)
+        return value
+    
+    def _record_quiet_cutoff(self, move: Tuple[Tuple[int, int], Tuple[int, int]],
+                             piece_index: int, depth: int, ply: int) -> None:
+        """
+        Update the killer and history tables for a quiet move that caused a beta cutoff.
         
-        return best_move
+        Args:
+            move: The move that caused the cutoff
+            piece_index: ChessPiece.index of the moving piece
+            depth: Remaining search depth at the node
+            ply: Distance of the node from the root
+        """
+        if ply < MAX_PLY:
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        
+        to_x, to_y = move[1]
+        key = (piece_index, to_y * 8 + to_x)
+        self.history[key] = self.history.get(key, 0) + depth * depth
     
-    def _alpha_beta(self, state: ChessState, depth: int, alpha: float, beta: float, 
-                   maximizing_player: bool) -> float:
+    def _quiescence(self, state: ChessState, alpha: int, beta: int, color: int,
+                    stand_pat: Optional[int] = None) -> int:
         """
-        Perform alpha-beta pruning search to evaluate positions.
+        Search captures only until the position is quiet, then evaluate it.
+        
+        The side to move may always "stand pat" on the static evaluation
+        instead of capturing.
         
         Args:
             state: Current chess state
-            depth: Remaining search depth
             alpha: Alpha value for pruning
             beta: Beta value for pruning
-            maximizing_player: True if current player is maximizing (white)
+            color: 1 if white is to move, -1 if black is to move
+            stand_pat: Static evaluation from the point of view of the side to move,
+                if already known
             
         Returns:
-            Position score
+            Position score from the point of view of the side to move
         """
-        # Increment node counter
         self.nodes_searched += 1
         
-        # Check for terminal conditions
-        if depth == 0 or state.is_checkmate() or state.is_stalemate():
-            return self._evaluate_position(state)
-        
-        legal_moves = self.move_generator.generate_moves(state)
-        
-        # No legal moves - checkmate or stalemate
-        if not legal_moves:
-            if state.is_check():  # Checkmate
-                return float('-inf') if maximizing_player else float('inf')
-            else:  # Stalemate
-                return 0
-        
-        # Order moves for better pruning
-        ordered_moves = self._order_moves(legal_moves, state)
-        
-        if maximizing_player:
-            value = float('-inf')
-            for move in ordered_moves:
-                new_state = self._make_move_copy(state, move)
-                value = max(value, self._alpha_beta(new_state, depth - 1, alpha, beta, False))
-                alpha = max(alpha, value)
-                if alpha >= beta:
-                    break  # Beta cutoff
-            return value
-        else:
-            value = float('inf')
-            for move in ordered_moves:
-                new_state = self._make_move_copy(state, move)
-                value = min(value, self._alpha_beta(new_state, depth - 1, alpha, beta, True))
-                beta = min(beta, value)
-                if beta <= alpha:
-                    break  # Alpha cutoff
-            return value
+        if stand_pat is None:
+            stand_pat = color * self._evaluate_position(state)
+        if stand_pat >= beta:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+        
+        # Most valuable victims first (MVV-LVA ordering)
+        captures = self._order_moves(self.move_generator.generate_captures(state), state)
+        
+        # Local names for everything used in the move loop (cheaper than attribute lookups)
+        quiescence = self._quiescence
+        make_move = state.make_move
+        unmake_move = state.unmake_move
+        
+        value = stand_pat
+        for move in captures:
+            (from_x, from_y), (to_x, to_y) = move
+            undo = make_move(from_x, from_y, to_x, to_y)
+            score = -quiescence(state, -beta, -alpha, -color)
+            unmake_move(from_x, from_y, to_x, to_y, undo)
+            
+            if score > value:
+                value = score
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+                
+        return value
     
-    def _make_move_copy(self, state: ChessState, move: Tuple[Tuple[int, int], Tuple[int, int]]) -> ChessState:
+    def _child_boards(self, state: ChessState,
+                      moves: List[Tuple[Tuple[int, int], Tuple[int, int]]]) -> np.ndarray:
         """
-        Create a new state with the move applied.
+        Build the square arrays of the positions reached by each move.
         
         Args:
-            state: Original chess state
-            move: Move to apply as ((from_x, from_y), (to_x, to_y))
+            state: Current chess state
+            moves: Legal moves in the current position
             
         Returns:
-            New chess state with the move applied
-        """
-        # This is a simplified implementation
-        # A more complete version would handle special moves properly
-        from_pos, to_pos = move
-        from_x, from_y = from_pos
-        to_x, to_y = to_pos
-        
-        # Create a deep copy of the state
-        new_state = ChessState()
-        new_state.board = state.board.copy()
-        new_state.active_color = state.active_color
-        new_state.castling_rights = {
-            color: rights[:] for color, rights in state.castling_rights.items()
-        }
-        new_state.en_passant_target = state.en_passant_target
-        new_state.halfmove_clock = state.halfmove_clock
-        new_state.fullmove_number = state.fullmove_number
-        new_state.move_history = state.move_history.copy()
+            (len(moves), 64) int8 array in the layout of ChessState.squares
+        """
+        squares = state.squares
+        boards = np.tile(np.frombuffer(squares, dtype=np.int8), (len(moves), 1))
+        from_squares = []
+        to_squares = []
+        special = []  # (row, square, code) fix-ups applied after the plain moves
+        
+        for row, ((from_x, from_y), (to_x, to_y)) in enumerate(moves):
+            from_sq = from_y * 8 + from_x
+            to_sq = to_y * 8 + to_x
+            from_squares.append(from_sq)
+            to_squares.append(to_sq)
+            
+            code = squares[from_sq]
+            if code == 1 or code == -1:
+                if to_y == 0 or to_y == 7:  # Promotion (always to a queen in the search)
+                    special.append((row, to_sq, 5 * code))
+                elif from_x != to_x and not squares[to_sq]:  # En passant
+                    special.append((row, from_y * 8 + to_x, 0))
+            elif (code == 6 or code == -6) and abs(to_x - from_x) == 2:  # Castling moves the rook too
+                rook_from, rook_to = (7, 5) if to_x > from_x else (0, 3)
+                special.append((row, from_y * 8 + rook_to, squares[from_y * 8 + rook_from]))
+                special.append((row, from_y * 8 + rook_from, 0))
+        
+        rows = np.arange(len(moves))
+        boards[rows, to_squares] = boards[rows, from_squares]
+        boards[rows, from_squares] = 0
+        for row, square, code in special:
+            boards[row, square] = code
+        return boards
+    
+    def _store_transposition(self, key: int, depth: int, value: int, alpha: int, beta: int,
+                             best_move: Optional[Tuple[Tuple[int, int], Tuple[int, int]]],
+                             ply: int = 0) -> None:
+        """
+        Store a search result in the transposition table.
+        
+        Args:
+            key: Zobrist hash of the searched position
+            depth: Depth the position was searched to
+            value: Score returned by the search
+            alpha: Alpha value the position was searched with
+            beta: Beta value the position was searched with
+            best_move: Best move found in the position
+            ply: Distance of the position from the root of the search
+        """
+        if value <= alpha:
+            flag = TT_UPPER
+        elif value >= beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
         
-        # Apply the move
-        new_state.make_move(from_x, from_y, to_x, to_y)
+        # Replace the slot's entry unless it holds a deeper search of this same position
+        index = key & self.tt_mask
+        entry_key, _, entry_depth_flag, _ = self.tt[index].tolist()
+        if entry_key == key and entry_depth_flag >> 8 > depth:
+            return
         
-        return new_state
+        if best_move is None:
+            packed_move = 0
+        else:
+            (from_x, from_y), (to_x, to_y) = best_move
+            packed_move = (from_y * 8 + from_x) | (to_y * 8 + to_x) << 6
+        
+        # Store mate scores as the distance from this position, which holds wherever it is reached
+        if value > MATE_THRESHOLD:
+            value += ply
+        elif value < -MATE_THRESHOLD:
+            value -= ply
+        self.tt[index] = (key, value, depth << 8 | flag, packed_move)
     
     def _order_moves(self, moves: List[Tuple[Tuple[int, int], Tuple[int, int]]], 
-                    state: ChessState) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+                    state: ChessState,
+                    tt_move: Optional[Tuple[Tuple[int, int], Tuple[int, int]]] = None,
+                    ply: Optional[int] = None
+                    ) -> Iterator[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """
         Order moves to optimize alpha-beta pruning.
         
+        Moves are produced in stages, so that work for later stages is
+        skipped entirely when the search cuts off early:
+        1. The transposition table move (if legal)
+        2. Captures - sorted by value of captured piece - value of capturing piece
+        3. Killer moves (quiet moves that caused a cutoff at the same ply)
+        4. Other moves - sorted by history score, then piece-square table improvement
+        
         Args:
             moves: List of legal moves
-            state: Current chess state
+            state: Current chess state (must be unchanged whenever the next move is requested)
+            tt_move: Best move from the transposition table, searched first if legal
+            ply: Distance from the root of the search, to look up killer moves
             
         Returns:
-            Ordered list of moves (best moves first)
+            Iterator over the moves, best moves first
         """
-        # This is a simple move ordering:
-        # 1. Captures - sorted by value of captured piece - value of capturing piece
-        # 2. Checks
-        # 3. Other moves
-        
-        # For simplicity, we'll just prioritize captures for now
-        move_scores = []
+        board = state.board
+        pst = self.evaluator.pst_tables
+        values = self.evaluator.piece_value_list
         
+        tt_move_found = False
+        captures = []
+        quiets = []
         for move in moves:
-            from_pos, to_pos = move
-            from_x, from_y = from_pos
-            to_x, to_y = to_pos
-            
-            score = 0
-            
-            # Get moving piece
-            moving_piece = state.get_piece_at(from_x, from_y)
-            if moving_piece is None:
+            if move == tt_move:
+                tt_move_found = True
                 continue
                 
-            # Check if capture (piece at target square)
-            target_piece = state.get_piece_at(to_x, to_y)
-            if target_piece is not None:
-                # MVV-LVA (Most Valuable Victim - Least Valuable Aggressor)
-                # Score captures higher based on value of captured piece minus value of capturing piece
-                moving_value = self.evaluator.piece_values[moving_piece.piece_type]
-                target_value = self.evaluator.piece_values[target_piece.piece_type]
-                score = target_value - (moving_value // 10)
-            
-            # Add positional improvement score
-            # Higher scores for moves to better squares according to piece-square tables
-            current_sq_value = self.evaluator.piece_square_tables[moving_piece.piece_type][from_y][from_x]
-            new_sq_value = self.evaluator.piece_square_tables[moving_piece.piece_type][to_y][to_x]
-            positional_improvement = new_sq_value - current_sq_value
+            (from_x, from_y), (to_x, to_y) = move
+            target_piece = board.get((to_x, to_y))
+            if target_piece is None:
+                quiets.append(move)
+                continue
             
-            score += positional_improvement // 10
+            # MVV-LVA (Most Valuable Victim - Least Valuable Aggressor)
+            # Score captures higher based on value of captured piece minus value of capturing piece
+            index = board[(from_x, from_y)].index
+            table = pst[index]
+            score = (
+                values[target_piece.index] - values[index] // 10 +
+                (table[to_y * 8 + to_x] - table[from_y * 8 + from_x]) // 10
+            )
+            captures.append((score, move))
+        
+        # The transposition table move was best last time, so try it first
+        if tt_move_found:
+            yield tt_move
+        
+        # Sort by score, highest first (stable, so ties keep generation order)
+        captures.sort(key=itemgetter(0), reverse=True)
+        for _, move in captures:
+            yield move
+        
+        # Quiet moves are only scored once all captures have been searched
+        killers = self.killers[ply] if ply is not None and ply < MAX_PLY else ()
+        for move in killers:
+            if move is not None and move != tt_move and move in quiets:
+                yield move
+        
+        history = self.history
+        scored = []
+        for move in quiets:
+            if move in killers:
+                continue
+            (from_x, from_y), (to_x, to_y) = move
+            index = board[(from_x, from_y)].index
+            to_square = to_y * 8 + to_x
             
-            move_scores.append((move, score))
-        
-        # Sort by score, highest first
-        move_scores.sort(key=lambda x: x[1], reverse=True)
-        
-        # Extract just the moves from the sorted list
-        return [move for move, _ in move_scores]
+            # Moves that often caused cutoffs come first, then moves to better
+            # squares according to piece-square tables
+            table = pst[index]
+            scored.append((
+                (history.get((index, to_square), 0), (table[to_square] - table[from_y * 8 + from_x]) // 10),
+                move
+            ))
+        
+        scored.sort(key=itemgetter(0), reverse=True)
+        for _, move in scored:
+            yield move
     
-    def _evaluate_position(self, state: ChessState) -> float:
+    def _evaluate_position(self, state: ChessState) -> int:
         """
         Evaluate the current chess position.
         
@@ -647,14 +797,9 @@ class ChessAI:
         Returns:
             Position score (positive favors white, negative favors black)
         """
-        # Use the PositionEvaluator to get a score
-        score = self.evaluator.evaluate(state)
-        
-        # Add a small random factor to prevent repetition and add variety
-        noise = random.uniform(-5, 5)
-        score += noise
-        
-        return score
+        # Use the PositionEvaluator to get a score in whole centipawns
+        # (no randomness here, so identical positions always score the same)
+        return self.evaluator.evaluate(state)
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -670,3 +815,58 @@ class ChessAI:
             "time_limit": self.time_limit
         }
 
+
+
+# Per-process engine used by the parallel root search workers
+_worker_ai: Optional[ChessAI] = None
+
+# The pool's table of running searches (see ChessAI._running_searches)
+_worker_running_searches = None
+
+
+def _init_worker(running_searches) -> None:
+    """
+    Set up a worker process of the parallel search pool.
+    
+    Args:
+        running_searches: The pool's shared table of running searches
+    """
+    global _worker_running_searches
+    _worker_running_searches = running_searches
+
+
+def _search_root_move(task: Tuple[ChessState, Tuple[Tuple[int, int], Tuple[int, int]], int, int, int, int]
+                      ) -> Tuple[Tuple[Tuple[int, int], Tuple[int, int]], int, int]:
+    """
+    Search a single root move in a worker process.
+    
+    Args:
+        task: Tuple of (state, move, iteration depth, score to beat, color to move, search id)
+        
+    Returns:
+        Tuple of (move, score, nodes searched); the score is -INF if the
+        search was called off before the move was searched
+    """
+    global _worker_ai
+    if _worker_ai is None:
+        _worker_ai = ChessAI()
+        _worker_ai.search_workers = 1
+        
+    state, move, depth, alpha, color, search_id = task
+    _worker_ai.nodes_searched = 0
+    
+    # Give up once the search that sent this move has finished or stopped
+    slot = search_id % PARALLEL_SEARCH_SLOTS
+    _worker_ai._abort_check = lambda: _worker_running_searches[slot] != search_id
+    if _worker_ai._abort_check():
+        return move, -INF, 0
+        
+    (from_x, from_y), (to_x, to_y) = move
+    state.make_move(from_x, from_y, to_x, to_y)
+    try:
+        # Only scores above alpha matter; anything else fails low
+        value = -_worker_ai._negamax(state, depth - 1, -INF, -alpha, -color, 1)
+    except _SearchAborted:
+        value = -INF
+    
+    return move, value, _worker_ai.nodes_searched
@@ -6,13 +6,16 @@ This script demonstrates Eve's chess-playing capabilities with different
 skill levels, personalities, and features.
 """
 
+import io
 import os
 import sys
-import time
+import atexit
 import random
 import chess
 import logging
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Tuple
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
@@ -26,6 +29,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger("eve_chess_demo")
 
+# Search depth cap for Eve's adapters so demo moves come back quickly
+DEMO_SEARCH_DEPTH = 8
+BRILLIANCY_SEARCH_DEPTH = 12
+
+# Frame printed around the board by print_chess_board
+_BOARD_HEADER = "\nCurrent Board Position:\n    a b c d e f g h\n  +-----------------+\n"
+_BOARD_FOOTER = "  +-----------------+\n    a b c d e f g h\n\n"
+
+
+@contextmanager
+def _buffered_output():
+    """
+    Collect everything printed in the block and write it out in one go.
+    
+    Output is left alone when stdout is a terminal, so someone watching
+    the demo still sees each move as it is played.
+    """
+    real_stdout = sys.stdout
+    if real_stdout.isatty():
+        yield
+        return
+    
+    buffer = io.StringIO()
+    sys.stdout = buffer
+    try:
+        yield
+    finally:
+        sys.stdout = real_stdout
+        real_stdout.write(buffer.getvalue())
+        real_stdout.flush()
+
+
+def _eval_personality(fen: str, personality: str, rating: int) -> Dict[str, Any]:
+    """
+    Get Eve's move for a position with a fresh adapter.
+    
+    Runs in a worker process, so every call owns its own Stockfish engine.
+    
+    Args:
+        fen: FEN string of the position
+        personality: Personality name for the adapter
+        rating: ELO rating for the adapter
+        
+    Returns:
+        Move data as returned by StockfishAdapter.get_move
+    """
+    adapter = StockfishAdapter(personality=personality, default_rating=rating)
+    try:
+        adapter.set_max_depth(DEMO_SEARCH_DEPTH)
+        return adapter.get_move(fen)
+    finally:
+        adapter.cleanup()
+
 
 class ChessDemonstration:
     """Chess demonstration for Eve's AI capabilities."""
@@ -34,6 +90,96 @@ class ChessDemonstration:
         """Initialize the demonstration."""
         self.demos_run = set()
         self.current_adapter = None
+        
+        # Stockfish adapters are expensive to start (one engine process each),
+        # so they are created once per (rating, personality) and reused
+        self._adapter_cache: Dict[Tuple[int, str], StockfishAdapter] = {}
+        self._opponent: Optional[StockfishAdapter] = None
+        atexit.register(self._cleanup_all)
+        
+        # Eve's moves in fixed demo positions, keyed by adapter settings and
+        # the position's Zobrist key, so repeated demos don't search again
+        self._move_cache: Dict[Tuple, Dict[str, Any]] = {}
+        
+        # One board reused by every demo, reset in place for each position
+        self._scratch_board = chess.Board()
+        
+        # Demos in menu order as (name, demo function); "all" runs every one
+        self._demos = (
+            ("skill", self.demo_skill_levels),
+            ("personality", self.demo_personalities),
+            ("opening", self.demo_opening_book),
+            ("blunder", self.demo_blunders_and_brilliancies),
+            ("commentary", self.demo_commentary),
+        )
+        self._demo_by_name = dict(self._demos)
+    
+    def _get_adapter(
+        self,
+        rating: int,
+        personality: Optional[str] = None,
+        max_depth: int = DEMO_SEARCH_DEPTH
+    ) -> StockfishAdapter:
+        """
+        Get a cached adapter for the given rating and personality.
+        
+        Args:
+            rating: ELO rating for the adapter
+            personality: Personality name (defaults to the adapter's 'solid')
+            max_depth: Search depth cap (lower rating depths are kept)
+            
+        Returns:
+            A StockfishAdapter configured for the rating and personality
+        """
+        key = (rating, personality or 'solid')
+        adapter = self._adapter_cache.get(key)
+        if adapter is None:
+            adapter = StockfishAdapter(personality=key[1], default_rating=rating)
+            self._adapter_cache[key] = adapter
+        adapter.set_max_depth(max_depth)
+        self.current_adapter = adapter
+        return adapter
+    
+    def _get_cached_move(
+        self,
+        adapter: StockfishAdapter,
+        board: chess.Board,
+        start_fen: str,
+        moves: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Get Eve's move for a board position, reusing earlier results.
+        
+        Args:
+            adapter: Adapter to search with on a cache miss
+            board: Board in the position to get a move for
+            start_fen: FEN the move list is played from
+            moves: Moves in UCI format leading from start_fen to the position
+            
+        Returns:
+            Move data as returned by StockfishAdapter.get_move
+        """
+        key = (adapter.target_elo, adapter.personality, board._transposition_key())
+        move_data = self._move_cache.get(key)
+        if move_data is None:
+            adapter.set_position(start_fen, moves)
+            move_data = adapter.get_move()
+            self._move_cache[key] = move_data
+        return move_data
+    
+    def _cleanup_all(self):
+        """Release every cached adapter."""
+        adapters = list(self._adapter_cache.values())
+        if self._opponent is not None:
+            adapters.append(self._opponent)
+        for adapter in adapters:
+            try:
+                adapter.cleanup()
+            except Exception:
+                pass
+        self._adapter_cache.clear()
+        self._opponent = None
+        self.current_adapter = None
     
     def print_header(self, title: str):
         """Print a formatted header."""
@@ -58,31 +204,20 @@ class ChessDemonstration:
     
     def print_chess_board(self, board: chess.Board):
         """Print ASCII representation of the chess board."""
-        print("\nCurrent Board Position:")
-        print("    a b c d e f g h")
-        print("  +-----------------+")
+        # str(board) gives the ranks from 8 down to 1, files separated by spaces
+        rows = str(board).split("\n")
+        body = "".join(f"{8 - i} | {row} | {8 - i}\n" for i, row in enumerate(rows))
         
-        for rank in range(7, -1, -1):
-            print(f"{rank+1} | ", end="")
-            for file in range(8):
-                square = chess.square(file, rank)
-                piece = board.piece_at(square)
-                if piece:
-                    symbol = piece.symbol()
-                else:
-                    symbol = "."
-                print(f"{symbol} ", end="")
-            print(f"| {rank+1}")
-            
-        print("  +-----------------+")
-        print("    a b c d e f g h\n")
+        sys.stdout.write(_BOARD_HEADER + body + _BOARD_FOOTER)
     
     def simulate_opponent_move(self, board: chess.Board, skill_level: int = 10):
         """Simulate an opponent's move at a given skill level."""
-        # Create a temporary Stockfish adapter for the opponent
-        opponent = StockfishAdapter(default_rating=1500)
+        # The opponent keeps one adapter for the whole demo
+        if self._opponent is None:
+            self._opponent = StockfishAdapter(default_rating=1500)
+            self._opponent.stockfish.set_depth(5)  # Lower depth for faster responses
+        opponent = self._opponent
         opponent.stockfish.set_skill_level(skill_level)
-        opponent.stockfish.set_depth(5)  # Lower depth for faster responses
         
         # Get the opponent's move
         fen = board.fen()
@@ -91,9 +226,6 @@ class ChessDemonstration:
         # Apply the move to the board
         board.push_uci(move_data['move'])
         
-        # Clean up
-        opponent.cleanup()
-        
         return move_data
     
     def demo_skill_levels(self):
@@ -107,42 +239,43 @@ class ChessDemonstration:
         ]
         
         for skill_name, elo in skill_levels:
-            print(f"\n▶ {skill_name} ◀")
-            print("-" * 50)
-            
-            # Create adapter with this skill level
-            adapter = StockfishAdapter(default_rating=elo)
-            self.current_adapter = adapter
-            
-            # Start from the initial position
-            board = chess.Board()
-            
-            # Make a few moves
-            for i in range(3):
-                # Simulate opponent move first (if not the first move)
-                if i > 0 or board.turn == chess.BLACK:
-                    opponent_move = self.simulate_opponent_move(board)
-                    print(f"\nOpponent plays: {opponent_move['move']}")
-                    self.print_chess_board(board)
+            with _buffered_output():
+                print(f"\n▶ {skill_name} ◀")
+                print("-" * 50)
                 
-                # Eve's turn
-                if board.is_game_over():
-                    print("Game over!")
-                    break
-                    
-                move_data = adapter.get_move(board.fen())
+                # Get the adapter for this skill level
+                adapter = self._get_adapter(elo)
                 
-                # Apply Eve's move
-                board.push_uci(move_data['move'])
+                # Start from the initial position
+                board = self._scratch_board
+                board.reset()
+                start_fen = board.fen()
+                move_history: List[str] = []
                 
-                # Print move details
-                self.print_move_details(move_data, i+1)
-                self.print_chess_board(board)
-                
-                time.sleep(1)  # Short pause between moves
-            
-            # Cleanup
-            adapter.cleanup()
+                # Make a few moves
+                for i in range(3):
+                    # Simulate opponent move first (if not the first move)
+                    if i > 0 or board.turn == chess.BLACK:
+                        opponent_move = self.simulate_opponent_move(board)
+                        move_history.append(opponent_move['move'])
+                        print(f"\nOpponent plays: {opponent_move['move']}")
+                        self.print_chess_board(board)
+                    
+                    # Eve's turn
+                    if board.is_game_over():
+                        print("Game over!")
+                        break
+                        
+                    adapter.set_position(start_fen, move_history)
+                    move_data = adapter.get_move()
+                    
+                    # Apply Eve's move
+                    board.push_uci(move_data['move'])
+                    move_history.append(move_data['move'])
+                    
+                    # Print move details
+                    self.print_move_details(move_data, i+1)
+                    self.print_chess_board(board)
             
             if skill_name != skill_levels[-1][0]:
                 input("\nPress Enter to continue to the next skill level...")
@@ -157,42 +290,54 @@ class ChessDemonstration:
         
         # Use the same position for all personalities to see the differences
         custom_fen = "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3"
+        rating = 1800
+        board = self._scratch_board
+        board.set_fen(custom_fen)
+        position_key = board._transposition_key()
+        
+        # The personalities search independently, so run the uncached ones
+        # side by side, each in its own process with its own engine
+        missing = [
+            personality for personality in personalities
+            if (rating, personality, position_key) not in self._move_cache
+        ]
+        if missing:
+            with ProcessPoolExecutor(max_workers=len(missing)) as pool:
+                futures = {
+                    personality: pool.submit(_eval_personality, custom_fen, personality, rating)
+                    for personality in missing
+                }
+                for personality, future in futures.items():
+                    self._move_cache[(rating, personality, position_key)] = future.result()
         
         for personality in personalities:
-            print(f"\n▶ {personality.capitalize()} Personality ◀")
-            print("-" * 50)
-            
-            # Create adapter with this personality
-            adapter = StockfishAdapter(personality=personality, default_rating=1800)
-            self.current_adapter = adapter
-            
-            # Set up the position
-            board = chess.Board(custom_fen)
-            self.print_chess_board(board)
-            
-            # Let Eve make a move with this personality
-            move_data = adapter.get_move(board.fen())
-            
-            # Apply the move
-            board.push_uci(move_data['move'])
-            
-            # Print move details
-            self.print_move_details(move_data, 1)
-            self.print_chess_board(board)
-            
-            # Cleanup
-            adapter.cleanup()
+            with _buffered_output():
+                print(f"\n▶ {personality.capitalize()} Personality ◀")
+                print("-" * 50)
+                
+                # Set up the position
+                board.set_fen(custom_fen)
+                self.print_chess_board(board)
+                
+                # Eve's move with this personality
+                move_data = self._move_cache[(rating, personality, position_key)]
+                
+                # Apply the move
+                board.push_uci(move_data['move'])
+                
+                # Print move details
+                self.print_move_details(move_data, 1)
+                self.print_chess_board(board)
             
-            if personality != personalities[-1]:
+            if personality != personalities[-1] and sys.stdin.isatty():
                 input("\nPress Enter to continue to the next personality...")
     
     def demo_opening_book(self):
         """Demonstrate Eve's opening book knowledge."""
         self.print_header("Eve's Opening Book Knowledge")
         
-        # Create adapter
-        adapter = StockfishAdapter(default_rating=1800)
-        self.current_adapter = adapter
+        # Get adapter
+        adapter = self._get_adapter(1800)
         
         # Test a few opening sequences
         opening_sequences = [
@@ -203,120 +348,115 @@ class ChessDemonstration:
         ]
         
         for opening_name, moves in opening_sequences:
-            print(f"\n▶ Testing: {opening_name} ◀")
-            print("-" * 50)
-            
-            # Set up the board with the moves
-            board = chess.Board()
-            for move in moves:
-                board.push_uci(move)
-            
-            self.print_chess_board(board)
-            
-            # Get Eve's move
-            adapter.set_position(board.fen(), moves)
-            move_data = adapter.get_move()
-            
-            # Apply the move
-            board.push_uci(move_data['move'])
-            
-            # Print move details
-            self.print_move_details(move_data, len(moves) + 1)
-            self.print_chess_board(board)
+            with _buffered_output():
+                print(f"\n▶ Testing: {opening_name} ◀")
+                print("-" * 50)
+                
+                # Set up the board with the moves
+                board = self._scratch_board
+                board.reset()
+                for move in moves:
+                    board.push_uci(move)
+                
+                self.print_chess_board(board)
+                
+                # Get Eve's move
+                move_data = self._get_cached_move(adapter, board, chess.STARTING_FEN, moves)
+                
+                # Apply the move
+                board.push_uci(move_data['move'])
+                
+                # Print move details
+                self.print_move_details(move_data, len(moves) + 1)
+                self.print_chess_board(board)
             
             if opening_name != opening_sequences[-1][0]:
                 input("\nPress Enter to continue to the next opening...")
-        
-        # Cleanup
-        adapter.cleanup()
     
     def demo_blunders_and_brilliancies(self):
         """Demonstrate Eve's occasional blunders and brilliancies."""
         self.print_header("Eve's Blunders and Brilliancies")
         
         # First: Blunders at low rating
-        print("\n▶ Potential Blunders (800 ELO) ◀")
-        print("-" * 50)
-        
-        # Create a low-rated adapter (more likely to blunder)
-        adapter = StockfishAdapter(default_rating=800)
-        self.current_adapter = adapter
-        
-        # Position where blunders are possible
-        blunder_fen = "r1bqkbnr/pppp1ppp/2n5/4p3/3PP3/5N2/PPP2PPP/RNBQKB1R b KQkq - 0 3"
-        board = chess.Board(blunder_fen)
-        
-        self.print_chess_board(board)
-        print("This position has obvious best moves. Let's see if beginner Eve blunders...")
-        
-        # Try 3 times to get a blunder
-        for i in range(3):
-            move_data = adapter.get_move(board.fen())
-            board_copy = chess.Board(blunder_fen)
-            board_copy.push_uci(move_data['move'])
+        with _buffered_output():
+            print("\n▶ Potential Blunders (800 ELO) ◀")
+            print("-" * 50)
             
-            # Print move details
-            self.print_move_details(move_data, i+1)
+            # Get a low-rated adapter (more likely to blunder)
+            adapter = self._get_adapter(800)
             
-            # Check if it's a "blunder"
-            if move_data.get('move_type') == 'blunder':
-                print("⚠️ THIS MOVE IS A BLUNDER! ⚠️")
+            # Position where blunders are possible
+            blunder_fen = "r1bqkbnr/pppp1ppp/2n5/4p3/3PP3/5N2/PPP2PPP/RNBQKB1R b KQkq - 0 3"
+            board = self._scratch_board
+            board.set_fen(blunder_fen)
             
-            time.sleep(1)
-        
-        adapter.cleanup()
+            self.print_chess_board(board)
+            print("This position has obvious best moves. Let's see if beginner Eve blunders...")
+            
+            # Try 3 times to get a blunder (the position doesn't change)
+            adapter.set_position(blunder_fen, [])
+            for i in range(3):
+                move_data = adapter.get_move()
+                board.push_uci(move_data['move'])
+                board.pop()
+                
+                # Print move details
+                self.print_move_details(move_data, i+1)
+                
+                # Check if it's a "blunder"
+                if move_data.get('move_type') == 'blunder':
+                    print("⚠️ THIS MOVE IS A BLUNDER! ⚠️")
         
         # Second: Brilliancies at higher rating
-        print("\n\n▶ Potential Brilliancies (1800 ELO) ◀")
-        print("-" * 50)
-        
-        # Create an adapter that might find brilliancies
-        adapter = StockfishAdapter(default_rating=1800, personality='creative')
-        self.current_adapter = adapter
-        
-        # Position where tactical brilliancies are possible
-        brilliancy_fen = "r1bq1rk1/ppp2ppp/2np1n2/2b1p3/2B1P3/2NP1N2/PPP2PPP/R1BQ1RK1 w - - 0 8"
-        board = chess.Board(brilliancy_fen)
-        
-        self.print_chess_board(board)
-        print("This position has tactical opportunities. Let's see if Eve finds a brilliancy...")
-        
-        # Try 5 times with different positions to get a brilliancy
-        found_brilliancy = False
-        for i in range(5):
-            # Slightly modify the position each time
-            if i > 0:
-                # Apply a random legal move to change the position
-                legal_moves = list(board.legal_moves)
-                if legal_moves:
-                    board.push(random.choice(legal_moves))
-                    self.print_chess_board(board)
+        with _buffered_output():
+            print("\n\n▶ Potential Brilliancies (1800 ELO) ◀")
+            print("-" * 50)
             
-            move_data = adapter.get_move(board.fen())
+            # Get an adapter that might find brilliancies
+            adapter = self._get_adapter(1800, 'creative', BRILLIANCY_SEARCH_DEPTH)
             
-            # Print move details
-            self.print_move_details(move_data, i+1)
+            # Position where tactical brilliancies are possible
+            brilliancy_fen = "r1bq1rk1/ppp2ppp/2np1n2/2b1p3/2B1P3/2NP1N2/PPP2PPP/R1BQ1RK1 w - - 0 8"
+            board.set_fen(brilliancy_fen)
+            move_history = []
             
-            # Check if it's a "brilliancy"
-            if move_data.get('move_type') == 'brilliant':
-                print("✨ BRILLIANCY FOUND! ✨")
-                found_brilliancy = True
-                break
+            self.print_chess_board(board)
+            print("This position has tactical opportunities. Let's see if Eve finds a brilliancy...")
+            
+            # Try 5 times with different positions to get a brilliancy
+            found_brilliancy = False
+            for i in range(5):
+                # Slightly modify the position each time
+                if i > 0:
+                    # Apply a random legal move to change the position
+                    legal_moves = list(board.legal_moves)
+                    if legal_moves:
+                        random_move = random.choice(legal_moves)
+                        board.push(random_move)
+                        move_history.append(random_move.uci())
+                        self.print_chess_board(board)
+                
+                adapter.set_position(brilliancy_fen, move_history)
+                move_data = adapter.get_move()
+                
+                # Print move details
+                self.print_move_details(move_data, i+1)
+                
+                # Check if it's a "brilliancy"
+                if move_data.get('move_type') == 'brilliant':
+                    print("✨ BRILLIANCY FOUND! ✨")
+                    found_brilliancy = True
+                    break
             
-            time.sleep(1)
-        
-        if not found_brilliancy:
-            print("\nNo brilliancies found in these positions (they're quite rare).")
-        
-        adapter.cleanup()
+            if not found_brilliancy:
+                print("\nNo brilliancies found in these positions (they're quite rare).")
     
     def demo_commentary(self):
         """Demonstrate Eve's chess commentary for different position types."""
         self.print_header("Eve's Chess Commentary")
         
-        # Create adapter
-        adapter = StockfishAdapter(default_rating=1800)
-        self.current_adapter = adapter
+        # Get adapter
+        adapter = self._get_adapter(1800)
         
         # Test positions with interesting features
         test_positions = [
@@ -329,53 +469,38 @@ class ChessDemonstration:
         ]
         
         for description, fen, moves in test_positions:
-            print(f"\n▶ {description} ◀")
-            print("-" * 50)
-            
-            # Set up the board
-            board = chess.Board(fen)
-            for move in moves:
-                board.push_uci(move)
+            with _buffered_output():
+                print(f"\n▶ {description} ◀")
+                print("-" * 50)
                 
-            self.print_chess_board(board)
-            
-            # Get Eve's move
-            move_data = adapter.get_move(board.fen())
-            
-            # Print move details
-            self.print_move_details(move_data, 1)
+                # Set up the board
+                board = self._scratch_board
+                board.set_fen(fen)
+                for move in moves:
+                    board.push_uci(move)
+                    
+                self.print_chess_board(board)
+                
+                # Get Eve's move
+                move_data = self._get_cached_move(adapter, board, fen, moves)
+                
+                # Print move details
+                self.print_move_details(move_data, 1)
             
             if description != test_positions[-1][0]:
                 input("\nPress Enter to continue to the next position...")
-        
-        # Cleanup
-        adapter.cleanup()
     
     def run_demo(self, demo_name: str = None):
         """Run a specific demo or all demos."""
-        demos = {
-            "skill": self.demo_skill_levels,
-            "personality": self.demo_personalities,
-            "opening": self.demo_opening_book,
-            "blunder": self.demo_blunders_and_brilliancies,
-            "commentary": self.demo_commentary,
-            "all": None  # Special case to run all demos
-        }
-        
         if demo_name is None:
             # Show menu if no demo specified
             self.show_menu()
             return
             
-        if demo_name not in demos:
-            print(f"Unknown demo: {demo_name}")
-            print(f"Available demos: {', '.join(demos.keys())}")
-            return
-            
         if demo_name == "all":
             print("\n🎮 Running all demos sequentially 🎮\n")
-            for name, demo_fn in demos.items():
-                if name != "all" and name not in self.demos_run:
+            for name, demo_fn in self._demos:
+                if name not in self.demos_run:
                     try:
                         print(f"\nRunning demo: {name}")
                         demo_fn()
@@ -384,14 +509,20 @@ class ChessDemonstration:
                     except Exception as e:
                         print(f"Error running demo {name}: {e}")
             print("\n🎮 All demos completed! 🎮")
-        else:
-            # Run the specified demo
-            demo_fn = demos[demo_name]
-            try:
-                demo_fn()
-                self.demos_run.add(demo_name)
-            except Exception as e:
-                print(f"Error running demo {demo_name}: {e}")
+            return
+            
+        demo_fn = self._demo_by_name.get(demo_name)
+        if demo_fn is None:
+            print(f"Unknown demo: {demo_name}")
+            print(f"Available demos: {', '.join(name for name, _ in self._demos)}, all")
+            return
+            
+        # Run the specified demo
+        try:
+            demo_fn()
+            self.demos_run.add(demo_name)
+        except Exception as e:
+            print(f"Error running demo {demo_name}: {e}")
     
     def show_menu(self):
         """Show interactive demo selection menu."""
@@ -409,22 +540,16 @@ class ChessDemonstration:
             
             choice = input("Enter your choice (0-6): ").strip()
             
-            demo_map = {
-                "1": "skill",
-                "2": "personality",
-                "3": "opening",
-                "4": "blunder",
-                "5": "commentary",
-                "6": "all"
-            }
-            
             if choice == "0":
                 print("\nExiting Eve's Chess AI Demonstration. Goodbye!")
                 break
                 
-            if choice in demo_map:
+            # Choices 1-5 are the demos in order, 6 runs them all
+            index = int(choice) - 1 if choice.isdecimal() else -1
+            if 0 <= index <= len(self._demos):
+                demo_name = self._demos[index][0] if index < len(self._demos) else "all"
                 try:
-                    self.run_demo(demo_map[choice])
+                    self.run_demo(demo_name)
                 except KeyboardInterrupt:
                     print("\n\nDemo interrupted. Returning to menu...")
                 except Exception as e:
@@ -432,14 +557,6 @@ class ChessDemonstration:
                     print("Returning to menu...")
             else:
                 print("\nInvalid choice. Please enter a number between 0 and 6.")
-            
-            # Clean up any lingering adapters
-            if self.current_adapter is not None:
-                try:
-                    self.current_adapter.cleanup()
-                except:
-                    pass
-                self.current_adapter = None
 
 
 def main():
@@ -5,9 +5,29 @@ This module provides functionality for evaluating chess positions,
 including material counting, piece-square tables, and positional heuristics.
 """
 
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Optional
 
-from .state_manager import ChessState, ChessPiece, PieceType, PieceColor
+import numpy as np
+
+from .state_manager import ChessState, ChessPiece, PieceType, PieceColor, PIECE_TYPE_ORDER
+
+
+# Number of set bits in a bitboard (int.bit_count needs Python 3.10+)
+popcount = getattr(int, 'bit_count', None) or (lambda bitboard: bin(bitboard).count('1'))
+
+# Game phase weights (opening, middlegame, endgame) at either end of the game
+OPENING_PHASE = (1.0, 0.0, 0.0)
+ENDGAME_PHASE = (0.0, 0.0, 1.0)
+
+# Material (excluding kings) above which the game is still in the opening
+OPENING_THRESHOLD = 7000
+
+# ChessPiece.index of the white king, the only piece whose table is blended by game phase
+WHITE_KING = PIECE_TYPE_ORDER.index(PieceType.KING)
+
+# Number of evaluated positions remembered, so transpositions aren't scored twice
+EVAL_CACHE_SIZE = 1 << 16
 
 
 class PositionEvaluator:
@@ -34,12 +54,53 @@ class PositionEvaluator:
         # These tables reflect the ideal squares for each piece type
         self.piece_square_tables = self._init_piece_square_tables()
         
+        # Flat versions of the tables above, indexed by ChessPiece.index and square y * 8 + x
+        # (black rows are pre-flipped) for fast integer lookups during evaluation and move ordering
+        self.pst_tables = self._init_flat_tables()
+        self.pst_flat = np.array(self.pst_tables, dtype=np.int32)
+        
+        # The king's endgame table, blended with its opening table by game phase
+        self.king_endgame_table = tuple(value for row in self.king_table_endgame for value in row)
+        
+        # The flat tables as used in the endgame, where the white king's table is the endgame one
+        self.pst_tables_endgame = (
+            self.pst_tables[:WHITE_KING] + (self.king_endgame_table,) + self.pst_tables[WHITE_KING + 1:]
+        )
+        
+        # Piece values by ChessPiece.index, with a trailing 0 entry (index 12) for "no piece"
+        self.piece_value_arr = np.array(
+            [self.piece_values[piece_type] for piece_type in PIECE_TYPE_ORDER] * 2 + [0],
+            dtype=np.int32
+        )
+        
+        # Plain-list copy for scalar lookups, which are faster on lists than on arrays
+        self.piece_value_list = self.piece_value_arr.tolist()
+        
+        # Lookups for evaluate_batch, with a trailing all-zero row (index 12) for "no piece"
+        # and the non-king values used to determine the game phase
+        self.pst_batch = np.vstack([self.pst_flat, np.zeros((1, 64), dtype=np.int32)])
+        self.phase_value_arr = self.piece_value_arr.copy()
+        self.phase_value_arr[[PIECE_TYPE_ORDER.index(PieceType.KING), 11]] = 0
+        self.king_opening_flat = self.pst_flat[PIECE_TYPE_ORDER.index(PieceType.KING)].astype(np.float64)
+        self.king_endgame_flat = np.array(self.king_endgame_table, dtype=np.float64)
+        
         # Phase weights for transitioning between opening, middlegame and endgame
         self.phase_weights = {
             'opening': 1.0,
             'middlegame': 0.0,
             'endgame': 0.0
         }
+        
+        # Whether evaluate_mobility / evaluate_king_safety compute real scores;
+        # while they are placeholders returning 0, evaluate() skips them
+        self._has_mobility_eval = False
+        self._has_king_safety_eval = False
+        
+        # Game phase weights for every material total up to the opening threshold
+        self._phase_table = tuple(self._phase_weights(material) for material in range(OPENING_THRESHOLD + 1))
+        
+        # Scores of recently evaluated positions by Zobrist hash, least recently used first
+        self._eval_cache: OrderedDict = OrderedDict()
     
     def _init_piece_square_tables(self) -> Dict[PieceType, List[List[int]]]:
         """
@@ -135,6 +196,9 @@ class PositionEvaluator:
             [-50, -30, -30, -30, -30, -30, -30, -50]
         ]
         
+        # Kept separately since the king's entry below is the opening table
+        self.king_table_endgame = king_table_endgame
+        
         return {
             PieceType.PAWN: pawn_table,
             PieceType.KNIGHT: knight_table,
@@ -144,7 +208,22 @@ class PositionEvaluator:
             PieceType.KING: king_table_opening,  # Use opening table by default
         }
         
-    def get_game_phase(self, state: ChessState) -> Dict[str, float]:
+    def _init_flat_tables(self) -> Tuple[Tuple[int, ...], ...]:
+        """
+        Flatten the piece-square tables into 64-entry tuples for every piece and color.
+        
+        Returns:
+            Tuples indexed by [ChessPiece.index][y * 8 + x]
+        """
+        tables = []
+        for flip in (False, True):  # White pieces first, then black
+            for piece_type in PIECE_TYPE_ORDER:
+                table = self.piece_square_tables[piece_type]
+                rows = table[::-1] if flip else table
+                tables.append(tuple(value for row in rows for value in row))
+        return tuple(tables)
+        
+    def get_game_phase(self, state: ChessState) -> Tuple[float, float, float]:
         """
         Determine the current phase of the game.
         
@@ -152,37 +231,49 @@ class PositionEvaluator:
             state: Current chess game state
             
         Returns:
-            Dictionary with weights for each game phase (opening, middlegame, endgame)
+            Tuple of weights for each game phase (opening, middlegame, endgame)
+        """
+        # Material (excluding kings) determines the game phase; the state
+        # keeps a running total of it. Below the opening threshold the
+        # weights come from a table with an entry per centipawn
+        total_material = state.phase_material
+        if total_material > OPENING_THRESHOLD:
+            return OPENING_PHASE
+        return self._phase_table[total_material]
+    
+    def _phase_weights(self, total_material: int) -> Tuple[float, float, float]:
         """
-        # Count material to determine game phase
-        total_material = 0
-        for piece in state.board.values():
-            if piece.piece_type != PieceType.KING:  # Exclude kings
-                total_material += self.piece_values[piece.piece_type]
+        Compute the game phase weights for a given amount of material.
         
+        Args:
+            total_material: Total material on the board, excluding kings
+            
+        Returns:
+            Tuple of weights for each game phase (opening, middlegame, endgame)
+        """
         # Full material (excluding kings) would be:
         # 8 pawns + 2 knights + 2 bishops + 2 rooks + 1 queen per side
         # = 8*100 + 2*320 + 2*330 + 2*500 + 1*900 = 3900 per side = 7800 total
         
         # Phase thresholds (these can be adjusted)
-        opening_threshold = 7000    # >90% material remains
+        opening_threshold = OPENING_THRESHOLD    # >90% material remains
         middlegame_threshold = 4000  # ~50% material remains
         endgame_threshold = 1500     # <20% material remains
         
         if total_material > opening_threshold:
-            return {'opening': 1.0, 'middlegame': 0.0, 'endgame': 0.0}
+            return OPENING_PHASE
         elif total_material > middlegame_threshold:
             # Linear transition from opening to middlegame
             opening_weight = (total_material - middlegame_threshold) / (opening_threshold - middlegame_threshold)
             middlegame_weight = 1.0 - opening_weight
-            return {'opening': opening_weight, 'middlegame': middlegame_weight, 'endgame': 0.0}
+            return (opening_weight, middlegame_weight, 0.0)
         elif total_material > endgame_threshold:
             # Linear transition from middlegame to endgame
             middlegame_weight = (total_material - endgame_threshold) / (middlegame_threshold - endgame_threshold)
             endgame_weight = 1.0 - middlegame_weight
-            return {'opening': 0.0, 'middlegame': middlegame_weight, 'endgame': endgame_weight}
+            return (0.0, middlegame_weight, endgame_weight)
         else:
-            return {'opening': 0.0, 'middlegame': 0.0, 'endgame': 1.0}
+            return ENDGAME_PHASE
     
     def evaluate_material(self, state: ChessState) -> int:
         """
@@ -194,63 +285,189 @@ class PositionEvaluator:
         Returns:
             Material score (positive favors white, negative favors black)
         """
+        # One popcount per piece bitboard, unrolled into a single expression
+        pawn, knight, bishop, rook, queen, king = self.piece_value_list[:6]
+        (white_pawns, white_knights, white_bishops, white_rooks, white_queens, white_king,
+         black_pawns, black_knights, black_bishops, black_rooks, black_queens, black_king) = state.bitboards
+        return (
+            pawn * (popcount(white_pawns) - popcount(black_pawns)) +
+            knight * (popcount(white_knights) - popcount(black_knights)) +
+            bishop * (popcount(white_bishops) - popcount(black_bishops)) +
+            rook * (popcount(white_rooks) - popcount(black_rooks)) +
+            queen * (popcount(white_queens) - popcount(black_queens)) +
+            king * (popcount(white_king) - popcount(black_king))
+        )
+    
+    def evaluate_piece_position(self, state: ChessState,
+                                phase: Optional[Tuple[float, float, float]] = None) -> int:
+        """
+        Evaluate piece positions using piece-square tables.
+        
+        Args:
+            state: Current chess game state
+            phase: Game phase weights from get_game_phase, if already known
+            
+        Returns:
+            Position score (positive favors white, negative favors black)
+        """
         score = 0
-        for piece in state.board.values():
-            value = self.piece_values[piece.piece_type]
-            if piece.color == PieceColor.WHITE:
-                score += value
+        
+        # Get current game phase, unless the caller already has it
+        if phase is None:
+            phase = self.get_game_phase(state)
+        opening, middlegame, endgame = phase
+        
+        # Walk each piece's bitboard, taking the lowest set bit each time.
+        # The flat tables are indexed by square, with black's rows pre-flipped
+        tables = self.pst_tables
+        bitboards = state.bitboards
+        for index in range(12):
+            if index == WHITE_KING:
+                continue
+            table = tables[index]
+            bitboard = bitboards[index]
+            table_score = 0
+            while bitboard:
+                low_bit = bitboard & -bitboard
+                table_score += table[low_bit.bit_length() - 1]
+                bitboard ^= low_bit
+            
+            # White pieces add to the score, black pieces subtract
+            if index < 6:
+                score += table_score
             else:
-                score -= value
+                score -= table_score
+        
+        # Only the white king's table is blended by game phase. There is a
+        # single such square, so blend the two values there rather than
+        # building a whole blended table
+        bitboard = bitboards[WHITE_KING]
+        if bitboard:
+            square = bitboard.bit_length() - 1
+            score += (
+                tables[WHITE_KING][square] * (opening + middlegame) +
+                self.king_endgame_table[square] * endgame
+            )
         
         return score
     
-    def evaluate_piece_position(self, state: ChessState) -> int:
+    def _evaluate_pieces(self, state: ChessState, phase: Tuple[float, float, float]) -> float:
         """
-        Evaluate piece positions using piece-square tables.
+        Evaluate material and piece positions together.
+        
+        Gives the same total as evaluate_material() + evaluate_piece_position(),
+        but walks each piece's bitboard only once.
         
         Args:
             state: Current chess game state
+            phase: Game phase weights from get_game_phase
             
         Returns:
-            Position score (positive favors white, negative favors black)
+            Combined score (positive favors white, negative favors black)
         """
+        values = self.piece_value_list
+        tables = self.pst_tables
+        bitboards = state.bitboards
         score = 0
+        for index in range(12):
+            bitboard = bitboards[index]
+            if not bitboard:
+                continue
+            piece_score = values[index] * popcount(bitboard)
+            
+            # The white king's table is blended by game phase below
+            if index != WHITE_KING:
+                table = tables[index]
+                while bitboard:
+                    low_bit = bitboard & -bitboard
+                    piece_score += table[low_bit.bit_length() - 1]
+                    bitboard ^= low_bit
+            
+            if index < 6:
+                score += piece_score
+            else:
+                score -= piece_score
         
-        # Get current game phase
-        phase = self.get_game_phase(state)
+        bitboard = bitboards[WHITE_KING]
+        if bitboard:
+            opening, middlegame, endgame = phase
+            square = bitboard.bit_length() - 1
+            score += (
+                tables[WHITE_KING][square] * (opening + middlegame) +
+                self.king_endgame_table[square] * endgame
+            )
         
-        # Create a blended king table based on game phase
-        king_table_opening = self.piece_square_tables[PieceType.KING]
-        king_table_endgame = [
-            [-50, -40, -30, -20, -20, -30, -40, -50],
-            [-30, -20, -10,   0,   0, -10, -20, -30],
-            [-30, -10,  20,  30,  30,  20, -10, -30],
-            [-30, -10,  30,  40,  40,  30, -10, -30],
-            [-30, -10,  30,  40,  40,  30, -10, -30],
-            [-30, -10,  20,  30,  30,  20, -10, -30],
-            [-30, -30,   0,   0,   0,   0, -30, -30],
-            [-50, -30, -30, -30, -30, -30, -30, -50]
-        ]
+        return score
+    
+    def _evaluate_pieces_fixed(self, state: ChessState, tables: Tuple[Tuple[int, ...], ...]) -> int:
+        """
+        Evaluate material and piece positions with no phase blending.
         
-        # Evaluate each piece's position
-        for (x, y), piece in state.board.items():
-            if piece.piece_type == PieceType.KING:
-                # Blend king tables based on game phase
-                table_value = (
-                    king_table_opening[y][x] * (phase['opening'] + phase['middlegame']) +
-                    king_table_endgame[y][x] * phase['endgame']
-                )
-            else:
-                table_value = self.piece_square_tables[piece.piece_type][y][x]
+        Used at either end of the game, where the white king's table is
+        a single table rather than a blend of two.
+        
+        Args:
+            state: Current chess game state
+            tables: Flat piece-square tables by ChessPiece.index
             
-            # White pieces use the tables as-is
-            if piece.color == PieceColor.WHITE:
-                score += table_value
-            # Black pieces use the tables flipped vertically
+        Returns:
+            Combined score (positive favors white, negative favors black)
+        """
+        values = self.piece_value_list
+        bitboards = state.bitboards
+        score = 0
+        for index in range(12):
+            bitboard = bitboards[index]
+            if not bitboard:
+                continue
+            piece_score = values[index] * popcount(bitboard)
+            table = tables[index]
+            while bitboard:
+                low_bit = bitboard & -bitboard
+                piece_score += table[low_bit.bit_length() - 1]
+                bitboard ^= low_bit
+            
+            if index < 6:
+                score += piece_score
             else:
-                flipped_y = 7 - y
-                score -= self.piece_square_tables[piece.piece_type][flipped_y][x]
+                score -= piece_score
+        
+        return score
+    
+    def _evaluate_opening(self, state: ChessState) -> float:
+        """
+        Evaluate a position in the opening phase.
+        
+        Equivalent to the general evaluation with phase weights (1, 0, 0):
+        mobility carries no weight and the king uses its opening table.
+        
+        Args:
+            state: Current chess game state
+            
+        Returns:
+            Position score (positive favors white, negative favors black)
+        """
+        score = self._evaluate_pieces_fixed(state, self.pst_tables)
+        if self._has_king_safety_eval:
+            score += self.evaluate_king_safety(state) * 0.3
+        return score
+    
+    def _evaluate_endgame(self, state: ChessState) -> float:
+        """
+        Evaluate a position in the endgame phase.
         
+        Equivalent to the general evaluation with phase weights (0, 0, 1):
+        king safety carries no weight and the king uses its endgame table.
+        
+        Args:
+            state: Current chess game state
+            
+        Returns:
+            Position score (positive favors white, negative favors black)
+        """
+        score = self._evaluate_pieces_fixed(state, self.pst_tables_endgame)
+        if self._has_mobility_eval:
+            score += self.evaluate_mobility(state) * 0.2
         return score
     
     def evaluate_mobility(self, state: ChessState, mobility_factor: float = 0.1) -> int:
@@ -297,30 +514,98 @@ class PositionEvaluator:
         Returns:
             Position score (positive favors white, negative favors black)
         """
-        # Get phase weights to determine how to weigh different factors
+        # The same position is reached by many move orders during search
+        cache = self._eval_cache
+        key = state.zobrist
+        score = cache.get(key)
+        if score is not None:
+            cache.move_to_end(key)
+            return score
+        
+        # Get phase weights to determine how to weigh different factors,
+        # with fixed-weight versions for either end of the game
         phase = self.get_game_phase(state)
+        if phase is OPENING_PHASE:
+            score = int(self._evaluate_opening(state))
+        elif phase is ENDGAME_PHASE:
+            score = int(self._evaluate_endgame(state))
+        else:
+            score = int(self._evaluate_blended(state, phase))
         
-        # Material evaluation (most important component)
-        material_score = self.evaluate_material(state)
+        cache[key] = score
+        if len(cache) > EVAL_CACHE_SIZE:
+            cache.popitem(last=False)
+        return score
+    
+    def _evaluate_blended(self, state: ChessState, phase: Tuple[float, float, float]) -> float:
+        """
+        Evaluate a position between the opening and the endgame.
+        
+        Args:
+            state: Current chess game state
+            phase: Game phase weights from get_game_phase
+            
+        Returns:
+            Position score (positive favors white, negative favors black)
+        """
+        opening, middlegame, endgame = phase
         
-        # Piece position evaluation
-        position_score = self.evaluate_piece_position(state)
+        # Material (most important component) and piece positions, in one pass
+        final_score = self._evaluate_pieces(state, phase)
         
         # Mobility evaluation (more important in middlegame/endgame)
-        mobility_score = self.evaluate_mobility(state)
-        mobility_weight = 0.1 * phase['middlegame'] + 0.2 * phase['endgame']
+        if self._has_mobility_eval:
+            mobility_weight = 0.1 * middlegame + 0.2 * endgame
+            final_score += self.evaluate_mobility(state) * mobility_weight
         
         # King safety (more important in opening/middlegame)
-        king_safety_score = self.evaluate_king_safety(state)
-        king_safety_weight = 0.3 * phase['opening'] + 0.2 * phase['middlegame']
-        
-        # Combine all factors into final score
-        final_score = (
-            material_score +
-            position_score +
-            mobility_score * mobility_weight +
-            king_safety_score * king_safety_weight
-        )
+        if self._has_king_safety_eval:
+            king_safety_weight = 0.3 * opening + 0.2 * middlegame
+            final_score += self.evaluate_king_safety(state) * king_safety_weight
         
+        # Phase weighting produces fractions; evaluate() rounds to whole centipawns
         return final_score
-
+    
+    def evaluate_batch(self, boards: np.ndarray) -> np.ndarray:
+        """
+        Evaluate many positions at once.
+        
+        Gives the same scores as evaluate(), but works directly on square arrays
+        (see ChessState.squares) so that sibling positions can be scored in a
+        single vectorized pass.
+        
+        Args:
+            boards: (N, 64) int8 array of signed piece codes, indexed by y * 8 + x
+            
+        Returns:
+            (N,) int64 array of position scores (positive favors white, negative favors black)
+        """
+        codes = boards.astype(np.intp)
+        signs = np.sign(codes)
+        
+        # Piece codes 1..6 / -1..-6 map to ChessPiece.index 0..5 / 6..11, empty squares to 12
+        index = np.where(codes > 0, codes - 1, np.where(codes < 0, 5 - codes, 12))
+        
+        # Game phase weights, mirroring get_game_phase()
+        total_material = self.phase_value_arr[index].sum(axis=1)
+        opening = np.where(total_material > 7000, 1.0,
+                           np.where(total_material > 4000, (total_material - 4000) / 3000, 0.0))
+        middlegame = np.where(total_material > 7000, 0.0,
+                              np.where(total_material > 4000, 1.0 - opening,
+                                       np.where(total_material > 1500, (total_material - 1500) / 2500, 0.0)))
+        endgame = np.where(total_material > 4000, 0.0,
+                           np.where(total_material > 1500, 1.0 - middlegame, 1.0))
+        
+        # Material plus piece-square values; the white king is scored separately
+        # since its table is blended by game phase
+        white_king = index == PIECE_TYPE_ORDER.index(PieceType.KING)
+        table_values = np.where(white_king, 0, self.pst_batch[index, np.arange(64)])
+        score = (signs * (self.piece_value_arr[index] + table_values)).sum(axis=1)
+        
+        has_king = white_king.any(axis=1)
+        king_square = white_king.argmax(axis=1)
+        king_score = (self.king_opening_flat[king_square] * (opening + middlegame) +
+                      self.king_endgame_flat[king_square] * endgame)
+        
+        # Truncate towards zero like int() in evaluate()
+        return np.trunc(score + np.where(has_king, king_score, 0.0)).astype(np.int64)
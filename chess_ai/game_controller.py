@@ -5,22 +5,102 @@ This module handles chess game sessions, commands, and interactions,
 serving as the interface between the AI and various platforms.
 """
 
+import asyncio
 import json
 import logging
 import time
 import os
+import re
+import threading
 import uuid
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any, Union
+from typing import Dict, List, Set, Tuple, Optional, Any, Union
 
 from .state_manager import ChessState, PieceType, PieceColor
 from .ai_engine import ChessAI
 
+# orjson is an optional, much faster drop-in for (de)serializing session files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Number of moves an active game may append to its move log before the
+# full session is written out again
+SNAPSHOT_INTERVAL = 20
+
+# Well-formed move notation: from and to squares, plus an optional promotion piece
+MOVE_PATTERN = re.compile(r"[a-h][1-8][a-h][1-8][qrbn]?")
+
+# Piece types for the promotion suffixes MOVE_PATTERN accepts
+PROMOTION_PIECES = {
+    "q": PieceType.QUEEN,
+    "r": PieceType.ROOK,
+    "b": PieceType.BISHOP,
+    "n": PieceType.KNIGHT
+}
+
+# Messages for the ways a game can be drawn, by ChessState.game_result() value
+DRAW_MESSAGES = {
+    "stalemate": "Stalemate! The game is a draw.",
+    "fifty_move_rule": "Draw by the fifty-move rule.",
+    "insufficient_material": "Draw by insufficient material."
+}
+
+# Board character for each ChessState.squares code: 1-6 are white pawn..king,
+# and negative codes (black pieces) index from the end of the string
+SQUARE_CHARS = ".PNBRQKkqrbnp"
+
+
+def _format_time_ns(timestamp_ns: int) -> str:
+    """
+    Format an epoch timestamp in nanoseconds as a local ISO 8601 string.
+    
+    Args:
+        timestamp_ns: Time since the epoch in nanoseconds (as from time.time_ns)
+        
+    Returns:
+        ISO 8601 date and time, matching datetime.now().isoformat()
+    """
+    return datetime.datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
+def _dump_json(data: Dict[str, Any], indent: bool = False) -> bytes:
+    """
+    Serialize data to JSON bytes, using orjson when it's installed.
+    
+    Args:
+        data: JSON-serializable data
+        indent: Whether to pretty-print with two-space indentation
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+
+def _load_json(raw: bytes) -> Any:
+    """
+    Deserialize JSON bytes, using orjson when it's installed.
+    
+    Args:
+        raw: UTF-8 encoded JSON
+        
+    Returns:
+        Deserialized data
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class GameSession:
     """
@@ -30,6 +110,13 @@ class GameSession:
     the game state, player information, and session metadata.
     """
     
+    # Fixed attribute set, so sessions carry no per-instance __dict__
+    __slots__ = (
+        'session_id', 'user_id', 'platform', 'user_color', 'difficulty', 'state',
+        'created_at', 'last_activity_ns', 'moves_played', 'is_active',
+        'outcome', 'outcome_reason', 'move_history', 'lock'
+    )
+    
     def __init__(self, 
                  session_id: str, 
                  user_id: str, 
@@ -56,8 +143,10 @@ class GameSession:
         self.state = ChessState()
         
         # Session metadata
-        self.created_at = datetime.datetime.now().isoformat()
-        self.last_activity = self.created_at
+        # (the last activity time is kept in epoch nanoseconds, since it's
+        # updated on every move, and only formatted as ISO 8601 when needed)
+        self.last_activity_ns = time.time_ns()
+        self.created_at = _format_time_ns(self.last_activity_ns)
         self.moves_played = 0
         self.is_active = True
         self.outcome = None  # None, "white_win", "black_win", "draw"
@@ -66,6 +155,9 @@ class GameSession:
         # Game history for analysis and display
         self.move_history: List[Dict[str, Any]] = []
         
+        # Serializes changes to the game, since AI moves are made on search threads
+        self.lock = threading.Lock()
+        
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the session to a dictionary for serialization.
@@ -89,6 +181,21 @@ class GameSession:
             "move_history": self.move_history
         }
     
+    def to_snapshot_dict(self) -> Dict[str, Any]:
+        """
+        Convert the session to a dictionary for an active game's snapshot.
+        
+        Same as to_dict but without the move history, which an active game
+        keeps in its append-only move log instead, so that the size of a
+        snapshot doesn't grow with the length of the game.
+        
+        Returns:
+            Dictionary representation of the session, minus its move history
+        """
+        data = self.to_dict()
+        del data["move_history"]
+        return data
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'GameSession':
         """
@@ -120,14 +227,23 @@ class GameSession:
         # Restore game state from FEN
         session.state.set_from_fen(data["state_fen"])
         
-        # Restore move history
-        session.move_history = data["move_history"]
+        # Restore move history (active game snapshots have none; see to_snapshot_dict)
+        session.move_history = data.get("move_history", [])
         
         return session
     
+    @property
+    def last_activity(self) -> str:
+        """Last activity time of this session as an ISO 8601 string."""
+        return _format_time_ns(self.last_activity_ns)
+    
+    @last_activity.setter
+    def last_activity(self, value: str) -> None:
+        self.last_activity_ns = int(datetime.datetime.fromisoformat(value).timestamp() * 1e9)
+    
     def update_activity(self) -> None:
         """Update the last activity timestamp for this session."""
-        self.last_activity = datetime.datetime.now().isoformat()
+        self.last_activity_ns = time.time_ns()
     
     def record_move(self, move_from: Tuple[int, int], move_to: Tuple[int, int], 
                    algebraic: str, move_time: float, evaluation: int) -> None:
@@ -152,11 +268,34 @@ class GameSession:
             "algebraic": algebraic,
             "time": move_time,
             "evaluation": evaluation,
-            "timestamp": datetime.datetime.now().isoformat()
+            "timestamp_ns": self.last_activity_ns
         }
         
         self.move_history.append(move_data)
     
+    def replay_move(self, move_data: Dict[str, Any]) -> None:
+        """
+        Re-apply a move previously recorded by record_move.
+        
+        Used to bring a session loaded from its last snapshot up to date
+        with the moves in its move log.
+        
+        Args:
+            move_data: Move record as created by record_move
+            
+        Raises:
+            ValueError: If the move can't be made in the current position
+        """
+        (from_x, from_y), (to_x, to_y) = move_data["from"], move_data["to"]
+        promotion = PROMOTION_PIECES.get(move_data["algebraic"][4:])
+        # make_move doesn't check legality itself (see ChessState.is_valid_move)
+        if (((from_x, from_y), (to_x, to_y)) not in self.state.get_legal_moves() or
+                self.state.make_move(from_x, from_y, to_x, to_y, promotion=promotion) is None):
+            raise ValueError(f"Logged move {move_data['algebraic']} is not legal in the restored position")
+        self.moves_played = move_data["move_number"]
+        self.last_activity_ns = move_data["timestamp_ns"]
+        self.move_history.append(move_data)
+    
     def end_game(self, outcome: str, reason: str) -> None:
         """
         End the game with the specified outcome.
@@ -192,15 +331,35 @@ class ChessGameController:
         else:
             self.data_dir = data_dir
             
-        # Create data directory if it doesn't exist
-        os.makedirs(self.data_dir, exist_ok=True)
+        # Create data and archive directories if they don't exist
+        self._data_path = Path(self.data_dir)
+        self._archive_path = self._data_path / "archive"
+        self._archive_path.mkdir(parents=True, exist_ok=True)
         
-        # Initialize AI engine
+        # Initialize AI engine, plus one engine per difficulty level (1-5) for
+        # games to search with. These share the main engine's transposition
+        # table and worker processes, so games at different levels never
+        # reconfigure one another's engine
         self.ai = ChessAI()
+        self.ais: Dict[int, ChessAI] = {}
+        for difficulty in range(1, 6):
+            engine = self.ai.spawn()
+            engine.set_difficulty(difficulty)
+            self.ais[difficulty] = engine
+        
+        # Threads for make_ai_move_async, so searches don't block the caller's event loop
+        self._search_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4,
+                                                   thread_name_prefix="chess-search")
         
         # Active games dictionary: {session_id: GameSession}
         self.active_games: Dict[str, GameSession] = {}
         
+        # Sessions in active_games by player: {(user_id, platform): {session_id, ...}}
+        self._user_index: Dict[Tuple[str, str], Set[str]] = {}
+        
+        # Moves played as of each session's last full snapshot: {session_id: moves_played}
+        self._snapshot_moves: Dict[str, int] = {}
+        
         # Load any active games from disk
         self._load_active_games()
         
@@ -208,19 +367,66 @@ class ChessGameController:
     
     def _load_active_games(self) -> None:
         """Load active game sessions from disk."""
-        session_files = Path(self.data_dir).glob("active_*.json")
+        session_files = list(self._data_path.glob("active_*.json"))
+        if not session_files:
+            return
+        
+        # Read and parse the files on a thread pool so that disk reads overlap,
+        # then rebuild the sessions here in file order
+        with ThreadPoolExecutor(max_workers=min(32, len(session_files))) as pool:
+            futures = [pool.submit(self._read_session_files, file_path) for file_path in session_files]
         
-        for file_path in session_files:
+        for file_path, future in zip(session_files, futures):
             try:
-                with open(file_path, 'r') as f:
-                    session_data = json.load(f)
+                session_data, logged_moves = future.result()
                     
                 session = GameSession.from_dict(session_data)
-                self.active_games[session.session_id] = session
+                self._snapshot_moves[session.session_id] = session.moves_played
+                
+                # The move log holds the game's move history: moves up to the
+                # snapshot are restored as history (unless the snapshot already
+                # had it) and any later ones are replayed onto the position
+                for move_data in logged_moves:
+                    if move_data["move_number"] > session.moves_played:
+                        session.replay_move(move_data)
+                    elif move_data["move_number"] > len(session.move_history):
+                        session.move_history.append(move_data)
+                
+                # Older snapshots carry the history themselves; move it into the
+                # log, since later snapshots won't include it
+                if "move_history" in session_data and session.move_history:
+                    log_path = self._move_log_path(session.session_id)
+                    temp_path = self._data_path / (log_path.name + ".tmp")
+                    with open(temp_path, 'wb') as f:
+                        f.write(b"".join(_dump_json(move_data) + b"\n" for move_data in session.move_history))
+                    os.replace(temp_path, log_path)
+                
+                self._add_session(session)
                 logger.info(f"Loaded active game session {session.session_id}")
             except Exception as e:
                 logger.error(f"Error loading game session from {file_path}: {e}")
     
+    def _read_session_files(self, file_path: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Read and parse an active session's snapshot and move log.
+        
+        Args:
+            file_path: Path of the session snapshot (active_<id>.json)
+            
+        Returns:
+            Tuple of (snapshot data, move records from the move log)
+        """
+        with open(file_path, 'rb') as f:
+            session_data = _load_json(f.read())
+        
+        logged_moves = []
+        log_path = self._move_log_path(session_data["session_id"])
+        if log_path.exists():
+            with open(log_path, 'rb') as f:
+                logged_moves = [_load_json(line) for line in f]
+        
+        return session_data, logged_moves
+    
     def _save_game_session(self, session: GameSession) -> None:
         """
         Save a game session to disk.
@@ -231,17 +437,73 @@ class ChessGameController:
         # Determine filename based on session status
         prefix = "active" if session.is_active else "completed"
         filename = f"{prefix}_{session.session_id}.json"
-        file_path = os.path.join(self.data_dir, filename)
+        file_path = self._data_path / filename
         
-        # Save session data
+        # Save session data. Active games are snapshotted periodically without
+        # their move history (which is in the move log); completed games are
+        # saved in full and pretty-printed
         try:
-            with open(file_path, 'w') as f:
-                json.dump(session.to_dict(), f, indent=2)
+            if session.is_active:
+                data = _dump_json(session.to_snapshot_dict())
+            else:
+                data = _dump_json(session.to_dict(), indent=True)
+            
+            # Write to a temporary file and swap it in, so that a crash mid-write
+            # never leaves a truncated session file behind
+            temp_path = self._data_path / (filename + ".tmp")
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, file_path)
+            
+            self._snapshot_moves[session.session_id] = session.moves_played
+            
+            # A completed game's file holds everything, so its active snapshot
+            # and move log are no longer needed
+            if not session.is_active:
+                for stale_path in (self._data_path / f"active_{session.session_id}.json",
+                                   self._move_log_path(session.session_id)):
+                    if stale_path.exists():
+                        stale_path.unlink()
                 
             logger.info(f"Saved game session {session.session_id} to {file_path}")
         except Exception as e:
             logger.error(f"Error saving game session {session.session_id}: {e}")
     
+    def _move_log_path(self, session_id: str) -> Path:
+        """
+        Get the path of an active game's move log.
+        
+        Args:
+            session_id: Game session ID
+            
+        Returns:
+            Path of the append-only log of the game's moves
+        """
+        return self._data_path / f"active_{session_id}.moves.jsonl"
+    
+    def _save_move(self, session: GameSession) -> None:
+        """
+        Persist a game session after a move.
+        
+        Rather than rewriting the whole session (including its full move
+        history) on every move, the latest move is appended to the game's
+        move log. The session snapshot (position and metadata) is rewritten
+        every SNAPSHOT_INTERVAL moves, and saved in full when the game ends.
+        
+        Args:
+            session: Game session that just recorded a move
+        """
+        if session.is_active:
+            try:
+                with open(self._move_log_path(session.session_id), 'ab') as f:
+                    f.write(_dump_json(session.move_history[-1]) + b"\n")
+            except Exception as e:
+                logger.error(f"Error logging move for game session {session.session_id}: {e}")
+        
+        moves_since_snapshot = session.moves_played - self._snapshot_moves.get(session.session_id, 0)
+        if not session.is_active or moves_since_snapshot >= SNAPSHOT_INTERVAL:
+            self._save_game_session(session)
+    
     def create_game(self, user_id: str, platform: str, 
                    user_color: str = "white", difficulty: int = 3) -> str:
         """
@@ -279,7 +541,7 @@ class ChessGameController:
         )
         
         # Store the session
-        self.active_games[session_id] = session
+        self._add_session(session)
         
         # Save to disk
         self._save_game_session(session)
@@ -314,10 +576,36 @@ class ChessGameController:
         Returns:
             List of active game sessions for the user
         """
-        return [
-            session for session in self.active_games.values()
-            if session.user_id == user_id and session.platform == platform and session.is_active
-        ]
+        sessions = (self.active_games[session_id] for session_id in self._user_index.get((user_id, platform), ()))
+        return [session for session in sessions if session.is_active]
+    
+    def _add_session(self, session: GameSession) -> None:
+        """
+        Add a session to active_games and the per-user index.
+        
+        Args:
+            session: Game session to add
+        """
+        self.active_games[session.session_id] = session
+        self._user_index.setdefault((session.user_id, session.platform), set()).add(session.session_id)
+    
+    def _remove_session(self, session_id: str) -> None:
+        """
+        Remove a session from active_games and the per-user index.
+        
+        Args:
+            session_id: Game session ID
+        """
+        session = self.active_games.pop(session_id, None)
+        if session is None:
+            return
+        
+        key = (session.user_id, session.platform)
+        session_ids = self._user_index.get(key)
+        if session_ids is not None:
+            session_ids.discard(session_id)
+            if not session_ids:
+                del self._user_index[key]
     
     def handle_command(self, session_id: str, command: str, args: List[str] = None) -> Dict[str, Any]:
         """
@@ -356,11 +644,14 @@ class ChessGameController:
             winner = "black" if session.user_color == PieceColor.WHITE else "white"
             loser = "white" if winner == "black" else "black"
             
-            session.end_game(
-                f"{winner}_win", 
-                f"{loser}_resignation"
-            )
-            self._save_game_session(session)
+            with session.lock:
+                if not session.is_active:
+                    return {"success": False, "error": "Game is already over"}
+                session.end_game(
+                    f"{winner}_win", 
+                    f"{loser}_resignation"
+                )
+                self._save_game_session(session)
             
             return {
                 "success": True,
@@ -372,9 +663,7 @@ class ChessGameController:
             
         elif command == "status":
             # Return game status information
-            is_check = session.state.is_check()
-            is_checkmate = session.state.is_checkmate()
-            is_stalemate = session.state.is_stalemate()
+            is_check, is_checkmate, is_stalemate = session.state.status()
             
             return {
                 "success": True,
@@ -415,67 +704,80 @@ class ChessGameController:
         # Check if it's the user's turn
         if session.state.active_color != session.user_color:
             return {"success": False, "error": "It's not your turn"}
+        
+        # Reject malformed notation up front rather than via an exception
+        if MOVE_PATTERN.fullmatch(algebraic_move) is None:
+            return {"success": False, "error": f"Invalid algebraic notation: {algebraic_move}"}
             
         try:
-            # Convert algebraic notation to coordinates
-            from_x, from_y, to_x, to_y = session.state.algebraic_to_coords(algebraic_move)
-            
-            # Record start time for performance tracking
-            start_time = time.time()
-            
-            # Make the move on the game state
-            move_successful = session.state.make_move(from_x, from_y, to_x, to_y)
-            
-            if not move_successful:
-                return {"success": False, "error": "Invalid move"}
+            with session.lock:
+                # Checked again now that no AI move can be applied meanwhile
+                if not session.is_active:
+                    return {"success": False, "error": "Game is already over"}
+                if session.state.active_color != session.user_color:
+                    return {"success": False, "error": "It's not your turn"}
+                    
+                # Convert algebraic notation to coordinates
+                from_x, from_y, to_x, to_y = session.state.algebraic_to_coords(algebraic_move)
+                promotion = PROMOTION_PIECES.get(algebraic_move[4:])
                 
-            # Calculate move time
-            move_time = time.time() - start_time
-            
-            # Record the move in session history
-            # For evaluation, we'd normally use a proper evaluation, but here we'll use 0 as placeholder
-            evaluation = 0
-            session.record_move(
-                (from_x, from_y), 
-                (to_x, to_y), 
-                algebraic_move, 
-                move_time,
-                evaluation
-            )
-            
-            # Check for game end conditions
-            if session.state.is_checkmate():
-                # Game over - user wins by checkmate
-                winner_color = "white" if session.user_color == PieceColor.WHITE else "black"
-                session.end_game(f"{winner_color}_win", "checkmate")
-                self._save_game_session(session)
+                # Record start time for performance tracking
+                start_time = time.time()
                 
-                return {
-                    "success": True,
-                    "message": f"Checkmate! You win!",
-                    "move": algebraic_move,
-                    "game_over": True,
-                    "outcome": f"{winner_color}_win",
-                    "reason": "checkmate"
-                }
+                # Make the move on the game state
+                move_successful = session.state.make_move(from_x, from_y, to_x, to_y, promotion=promotion)
                 
-            if session.state.is_stalemate():
-                # Game over - draw by stalemate
-                session.end_game("draw", "stalemate")
-                self._save_game_session(session)
+                if not move_successful:
+                    return {"success": False, "error": "Invalid move"}
+                    
+                # Calculate move time
+                move_time = time.time() - start_time
                 
-                return {
-                    "success": True,
-                    "message": "Stalemate! The game is a draw.",
-                    "move": algebraic_move,
-                    "game_over": True,
-                    "outcome": "draw",
-                    "reason": "stalemate"
-                }
+                # Record the move in session history
+                # For evaluation, we'd normally use a proper evaluation, but here we'll use 0 as placeholder
+                evaluation = 0
+                session.record_move(
+                    (from_x, from_y), 
+                    (to_x, to_y), 
+                    algebraic_move, 
+                    move_time,
+                    evaluation
+                )
+                
+                # Check for game end conditions
+                result = session.state.game_result()
+                if result == "checkmate":
+                    # Game over - user wins by checkmate
+                    winner_color = "white" if session.user_color == PieceColor.WHITE else "black"
+                    session.end_game(f"{winner_color}_win", "checkmate")
+                    self._save_game_session(session)
+                    
+                    return {
+                        "success": True,
+                        "message": f"Checkmate! You win!",
+                        "move": algebraic_move,
+                        "game_over": True,
+                        "outcome": f"{winner_color}_win",
+                        "reason": "checkmate"
+                    }
+                    
+                if result is not None:
+                    # Game over - draw by stalemate, fifty-move rule or insufficient material
+                    session.end_game("draw", result)
+                    self._save_game_session(session)
+                    
+                    return {
+                        "success": True,
+                        "message": DRAW_MESSAGES[result],
+                        "move": algebraic_move,
+                        "game_over": True,
+                        "outcome": "draw",
+                        "reason": result
+                    }
+                    
+                # Save the updated game state
+                self._save_move(session)
                 
-            # Save the updated game state
-            self._save_game_session(session)
-            
             # If game continues, make AI move
             ai_response = self.make_ai_move(session_id)
             
@@ -496,12 +798,14 @@ class ChessGameController:
             logger.error(f"Error making move in session {session_id}: {e}")
             return {"success": False, "error": "An unexpected error occurred"}
     
-    def make_ai_move(self, session_id: str) -> Dict[str, Any]:
+    def make_ai_move(self, session_id: str, ai: Optional[ChessAI] = None) -> Dict[str, Any]:
         """
         Generate and execute an AI move for the given game.
         
         Args:
             session_id: Game session ID
+            ai: Engine to search with (default: the controller's engine for the
+                game's difficulty)
             
         Returns:
             Response dictionary with AI move information
@@ -519,109 +823,141 @@ class ChessGameController:
         if session.state.active_color == session.user_color:
             return {"success": False, "error": "It's not AI's turn"}
         
-        # Set AI difficulty for this game
-        self.ai.set_difficulty(session.difficulty)
+        # Use the engine for this game's difficulty unless given one
+        if ai is None:
+            ai = self.ais.get(session.difficulty, self.ai)
         
         # Measure time for AI thinking
         start_time = time.time()
         
         try:
-            # Get the best move from the AI
-            best_move = self.ai.get_best_move(session.state)
+            # Search a snapshot, so that the game's state stays consistent for
+            # other readers (and writers) while the engine makes and unmakes moves
+            moves_played = session.moves_played
+            best_move = ai.get_best_move(session.state.copy())
             
-            if best_move is None:
-                # No legal moves available - this shouldn't happen unless the game is already over
-                if session.state.is_checkmate():
-                    winner_color = "white" if session.user_color == PieceColor.WHITE else "black"
-                    session.end_game(f"{winner_color}_win", "checkmate")
-                elif session.state.is_stalemate():
-                    session.end_game("draw", "stalemate")
-                else:
-                    # Some other reason
-                    session.end_game("draw", "no_legal_moves")
-                self._save_game_session(session)
+            with session.lock:
+                # The game may have been moved in, resigned etc. during the search
+                if not session.is_active or session.moves_played != moves_played:
+                    return {"success": False, "error": "The game changed while Eve was thinking"}
+                    
+                if best_move is None:
+                    # No legal moves available - this shouldn't happen unless the game is already over
+                    result = session.state.game_result()
+                    if result == "checkmate":
+                        winner_color = "white" if session.user_color == PieceColor.WHITE else "black"
+                        session.end_game(f"{winner_color}_win", "checkmate")
+                    elif result is not None:
+                        session.end_game("draw", result)
+                    else:
+                        # Some other reason
+                        session.end_game("draw", "no_legal_moves")
+                    self._save_game_session(session)
+                    
+                    return {
+                        "success": False,
+                        "error": "No legal moves available",
+                        "game_over": True,
+                        "outcome": session.outcome,
+                        "reason": session.outcome_reason
+                    }
+                    
+                # Unpack the move coordinates
+                (from_x, from_y), (to_x, to_y) = best_move
                 
-                return {
-                    "success": False,
-                    "error": "No legal moves available",
-                    "game_over": True,
-                    "outcome": session.outcome,
-                    "reason": session.outcome_reason
-                }
+                # Apply the move to the state
+                move_successful = session.state.make_move(from_x, from_y, to_x, to_y)
                 
-            # Unpack the move coordinates
-            (from_x, from_y), (to_x, to_y) = best_move
-            
-            # Apply the move to the state
-            move_successful = session.state.make_move(from_x, from_y, to_x, to_y)
-            
-            if not move_successful:
-                return {"success": False, "error": "AI generated an invalid move"}
+                if not move_successful:
+                    return {"success": False, "error": "AI generated an invalid move"}
+                    
+                # Calculate total move time
+                move_time = time.time() - start_time
                 
-            # Calculate total move time
-            move_time = time.time() - start_time
-            
-            # Convert to algebraic notation for user display
-            algebraic_move = session.state.coords_to_algebraic(from_x, from_y, to_x, to_y)
-            
-            # Get evaluation of position after move
-            evaluation = self.ai.evaluator.evaluate(session.state)
-            
-            # Record the AI move
-            session.record_move(
-                (from_x, from_y),
-                (to_x, to_y),
-                algebraic_move,
-                move_time,
-                evaluation
-            )
-            
-            # Check for game end conditions
-            is_checkmate = session.state.is_checkmate()
-            is_stalemate = session.state.is_stalemate()
-            is_check = session.state.is_check()
-            
-            response = {
-                "success": True,
-                "move": algebraic_move,
-                "from": (from_x, from_y),
-                "to": (to_x, to_y),
-                "time_taken": move_time,
-                "evaluation": evaluation,
-                "nodes_searched": self.ai.get_statistics()["nodes_searched"],
-                "is_check": is_check,
-                "game_over": False
-            }
-            
-            if is_checkmate:
-                # Game over - AI wins by checkmate
-                winner_color = "black" if session.user_color == PieceColor.WHITE else "white"
-                session.end_game(f"{winner_color}_win", "checkmate")
-                response["game_over"] = True
-                response["outcome"] = f"{winner_color}_win"
-                response["reason"] = "checkmate"
-                response["message"] = "Checkmate! Eve wins!"
-            elif is_stalemate:
-                # Game over - draw by stalemate
-                session.end_game("draw", "stalemate")
-                response["game_over"] = True
-                response["outcome"] = "draw"
-                response["reason"] = "stalemate"
-                response["message"] = "Stalemate! The game is a draw."
-            elif is_check:
-                response["message"] = "Check!"
-            else:
-                response["message"] = "Eve has moved."
+                # Convert to algebraic notation for user display
+                algebraic_move = session.state.coords_to_algebraic(from_x, from_y, to_x, to_y)
                 
-            # Save the updated game state
-            self._save_game_session(session)
-            
-            return response
+                # Get evaluation of position after move
+                evaluation = ai.evaluator.evaluate(session.state)
+                
+                # Record the AI move
+                session.record_move(
+                    (from_x, from_y),
+                    (to_x, to_y),
+                    algebraic_move,
+                    move_time,
+                    evaluation
+                )
+                
+                # Check for game end conditions
+                result = session.state.game_result()
+                is_check = session.state.is_check()
+                
+                response = {
+                    "success": True,
+                    "move": algebraic_move,
+                    "from": (from_x, from_y),
+                    "to": (to_x, to_y),
+                    "time_taken": move_time,
+                    "evaluation": evaluation,
+                    "nodes_searched": ai.get_statistics()["nodes_searched"],
+                    "is_check": is_check,
+                    "game_over": False
+                }
+                
+                if result == "checkmate":
+                    # Game over - AI wins by checkmate
+                    winner_color = "black" if session.user_color == PieceColor.WHITE else "white"
+                    session.end_game(f"{winner_color}_win", "checkmate")
+                    response["game_over"] = True
+                    response["outcome"] = f"{winner_color}_win"
+                    response["reason"] = "checkmate"
+                    response["message"] = "Checkmate! Eve wins!"
+                elif result is not None:
+                    # Game over - draw by stalemate, fifty-move rule or insufficient material
+                    session.end_game("draw", result)
+                    response["game_over"] = True
+                    response["outcome"] = "draw"
+                    response["reason"] = result
+                    response["message"] = DRAW_MESSAGES[result]
+                elif is_check:
+                    response["message"] = "Check!"
+                else:
+                    response["message"] = "Eve has moved."
+                    
+                # Save the updated game state
+                self._save_move(session)
+                
+                return response
             
         except Exception as e:
             logger.error(f"Error making AI move in session {session_id}: {e}")
             return {"success": False, "error": "An unexpected error occurred with the AI move"}
     
+    async def make_ai_move_async(self, session_id: str) -> Dict[str, Any]:
+        """
+        Generate and execute an AI move without blocking the event loop.
+        
+        The move is made by make_ai_move on one of the controller's search
+        threads, with an engine of its own (sharing the transposition table),
+        so that several games can be thinking at once. The search works on a
+        copy of the game's state, and the game is only locked while the
+        chosen move is applied.
+        
+        Args:
+            session_id: Game session ID
+            
+        Returns:
+            Response dictionary with AI move information
+        """
+        session = self.get_game(session_id)
+        if session is None:
+            return {"success": False, "error": "Game session not found"}
+        
+        ai = self.ais.get(session.difficulty, self.ai).spawn()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._search_executor, self.make_ai_move, session_id, ai)
+    
     def resign_game(self, session_id: str) -> Dict[str, Any]:
         """
         Handle player resignation from a game.
@@ -637,19 +973,20 @@ class ChessGameController:
         if session is None:
             return {"success": False, "error": "Game session not found"}
             
-        # Check if game is still active
-        if not session.is_active:
-            return {"success": False, "error": "Game is already over"}
-            
         # Determine winner based on user color (opposite of user color wins)
         winner_color = "black" if session.user_color == PieceColor.WHITE else "white"
         loser_color = "white" if winner_color == "black" else "black"
         
-        # End the game
-        session.end_game(f"{winner_color}_win", f"{loser_color}_resignation")
-        
-        # Save the updated session
-        self._save_game_session(session)
+        with session.lock:
+            # Check if game is still active
+            if not session.is_active:
+                return {"success": False, "error": "Game is already over"}
+                
+            # End the game
+            session.end_game(f"{winner_color}_win", f"{loser_color}_resignation")
+            
+            # Save the updated session
+            self._save_game_session(session)
         
         return {
             "success": True,
@@ -669,46 +1006,43 @@ class ChessGameController:
         Returns:
             Number of sessions cleaned up
         """
-        # Calculate cutoff date
-        cutoff_time = (datetime.datetime.now() - 
-                        datetime.timedelta(days=max_age_days)).isoformat()
+        # Calculate cutoff time (epoch nanoseconds)
+        cutoff_ns = time.time_ns() - max_age_days * 86400 * 10**9
         
         sessions_to_remove = []
         
         # Find inactive sessions older than cutoff
         for session_id, session in self.active_games.items():
-            if not session.is_active and session.last_activity < cutoff_time:
+            if not session.is_active and session.last_activity_ns < cutoff_ns:
                 sessions_to_remove.append(session_id)
                 
-                # If session is already saved as completed, archive it
-                src_file = os.path.join(self.data_dir, f"completed_{session_id}.json")
-                if os.path.exists(src_file):
-                    # Create archive directory if needed
-                    archive_dir = os.path.join(self.data_dir, "archive")
-                    os.makedirs(archive_dir, exist_ok=True)
-                    
-                    # Move file to archive
-                    dst_file = os.path.join(archive_dir, f"completed_{session_id}.json")
-                    try:
-                        os.rename(src_file, dst_file)
-                        logger.info(f"Archived game session {session_id}")
-                    except Exception as e:
-                        logger.error(f"Error archiving session {session_id}: {e}")
+                # If session is already saved as completed, move it to the archive
+                # (attempting the rename directly, rather than checking first)
+                filename = f"completed_{session_id}.json"
+                try:
+                    os.rename(self._data_path / filename, self._archive_path / filename)
+                    logger.info(f"Archived game session {session_id}")
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.error(f"Error archiving session {session_id}: {e}")
         
         # Remove sessions from memory
         for session_id in sessions_to_remove:
-            self.active_games.pop(session_id, None)
+            self._remove_session(session_id)
             
         logger.info(f"Cleaned up {len(sessions_to_remove)} inactive game sessions")
         return len(sessions_to_remove)
     
-    def get_game_state(self, session_id: str, include_history: bool = False) -> Dict[str, Any]:
+    def get_game_state(self, session_id: str, include_history: bool = False,
+                       include_board: bool = False) -> Dict[str, Any]:
         """
         Get the current state of a game in a format suitable for display.
         
         Args:
             session_id: Game session ID
             include_history: Whether to include full move history
+            include_board: Whether to include the board as a grid of piece characters
             
         Returns:
             Dictionary with game state information
@@ -719,6 +1053,7 @@ class ChessGameController:
             return {"success": False, "error": "Game session not found"}
         
         # Basic game information
+        is_check, is_checkmate, is_stalemate = session.state.status()
         game_info = {
             "success": True,
             "session_id": session.session_id,
@@ -729,28 +1064,23 @@ class ChessGameController:
             "active_color": "white" if session.state.active_color == PieceColor.WHITE else "black",
             "moves_played": session.moves_played,
             "is_user_turn": session.state.active_color == session.user_color,
-            "is_check": session.state.is_check(),
-            "is_checkmate": session.state.is_checkmate(),
-            "is_stalemate": session.state.is_stalemate(),
+            "is_check": is_check,
+            "is_checkmate": is_checkmate,
+            "is_stalemate": is_stalemate,
             "is_active": session.is_active,
             "outcome": session.outcome,
             "outcome_reason": session.outcome_reason,
             "fen": session.state.get_fen()
         }
         
-        # Include board representation
-        board_rep = []
-        for y in range(7, -1, -1):  # Start from top rank (7) down to bottom rank (0)
-            rank = []
-            for x in range(8):  # Files from a to h (0 to 7)
-                piece = session.state.get_piece_at(x, y)
-                if piece:
-                    rank.append(str(piece))  # Use the string representation of the piece
-                else:
-                    rank.append(".")  # Empty square
-            board_rep.append(rank)
-        
-        game_info["board"] = board_rep
+        # Include board representation if requested, from the top rank (7) down
+        # to the bottom rank (0) and files a to h, with "." for empty squares
+        if include_board:
+            board = session.state.board
+            game_info["board"] = [
+                [str(board[(x, y)]) if (x, y) in board else "." for x in range(8)]
+                for y in range(7, -1, -1)
+            ]
         
         # Include last move if any moves have been played
         if session.move_history:
@@ -776,34 +1106,29 @@ class ChessGameController:
         if session is None:
             return "Game not found"
             
-        # Create ASCII board
-        board_str = "    a b c d e f g h\n"
-        board_str += "  +-----------------+\n"
+        # Create ASCII board from the squares array, one line per rank
+        squares = session.state.squares
+        parts = ["    a b c d e f g h\n", "  +-----------------+\n"]
         
         for y in range(7, -1, -1):
-            board_str += f"{y+1} | "
-            for x in range(8):
-                piece = session.state.get_piece_at(x, y)
-                if piece:
-                    board_str += str(piece) + " "
-                else:
-                    board_str += ". "
-            board_str += f"| {y+1}\n"
+            rank = " ".join([SQUARE_CHARS[code] for code in squares[y * 8:y * 8 + 8]])
+            parts.append(f"{y+1} | {rank} | {y+1}\n")
             
-        board_str += "  +-----------------+\n"
-        board_str += "    a b c d e f g h\n"
+        parts.append("  +-----------------+\n")
+        parts.append("    a b c d e f g h\n")
         
         # Add turn indicator
         turn = "White" if session.state.active_color == PieceColor.WHITE else "Black"
-        board_str += f"\nTurn: {turn}"
+        parts.append(f"\nTurn: {turn}")
         
         # Add check/checkmate/stalemate indicators
-        if session.state.is_checkmate():
-            board_str += " (Checkmate!)"
-        elif session.state.is_check():
-            board_str += " (Check!)"
-        elif session.state.is_stalemate():
-            board_str += " (Stalemate!)"
-            
-        return board_str
+        is_check, is_checkmate, is_stalemate = session.state.status()
+        if is_checkmate:
+            parts.append(" (Checkmate!)")
+        elif is_check:
+            parts.append(" (Check!)")
+        elif is_stalemate:
+            parts.append(" (Stalemate!)")
+            
+        return "".join(parts)
 
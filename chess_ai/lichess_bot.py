@@ -8,15 +8,24 @@ including account setup, game interactions, and move synchronization.
 
 import os
 import sys
+import json
 import time
 import logging
+import threading
 import chess
 import requests
 import berserk
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List, Tuple
 from dotenv import load_dotenv
 from pathlib import Path
 
+from .state_manager import ChessState, ChessPiece, PieceType, PieceColor
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,6 +36,78 @@ logger = logging.getLogger("lichess_bot")
 # Load environment variables from .env file
 load_dotenv()
 
+# The project's piece types indexed by python-chess piece type (1-6, PAWN..KING)
+# and its colors indexed by python-chess color (False/True, BLACK/WHITE)
+PIECE_TYPE_MAP = (
+    None, PieceType.PAWN, PieceType.KNIGHT, PieceType.BISHOP,
+    PieceType.ROOK, PieceType.QUEEN, PieceType.KING
+)
+COLOR_MAP = (PieceColor.BLACK, PieceColor.WHITE)
+
+# Number of positions whose best move is remembered across turns and games
+MOVE_CACHE_SIZE = 10000
+
+# Connection pool shared by the event stream, the game streams and all API calls;
+# one stream per game plus the event stream and occasional POSTs
+HTTP_POOL_SIZE = 16
+
+# Retries for transient Lichess errors (only idempotent requests, never move POSTs).
+# 429 is left out: Lichess asks clients to wait a full minute after one
+HTTP_RETRIES = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+
+# Number of game streams Lichess lets one account hold open at once
+MAX_GAME_STREAMS = 6
+
+# Seconds between polls of a correspondence game, which holds no stream in between
+CORRESPONDENCE_POLL_INTERVAL = 600
+
+# Number of likely opponent moves to prepare replies for while waiting for them
+PONDER_MOVES = 3
+
+
+class GameEntry:
+    """Tracks the position of one ongoing game."""
+    
+    # Read on every streamed event; slots avoid a per-instance __dict__
+    __slots__ = (
+        'color', 'initial_fen', 'engine', 'ponder_engine', 'ponder_future',
+        'board', 'chess_state', 'plies', 'future', 'searched_plies', 'lock'
+    )
+    
+    def __init__(self, color: chess.Color, initial_fen: str, engine=None):
+        """
+        Initialize a game entry at the game's starting position.
+        
+        Args:
+            color: The color we play in this game
+            initial_fen: FEN of the game's starting position
+            engine: AI engine searching this game's moves
+        """
+        self.color = color
+        self.initial_fen = initial_fen
+        self.engine = engine
+        
+        # Separate engine for searching ahead during the opponent's turn
+        # (see LichessBot._ponder), and its pending task
+        self.ponder_engine = engine.spawn() if engine is not None else None
+        self.ponder_future: Optional[Future] = None
+        
+        # python-chess board and the matching ChessState, plus how many
+        # moves of the game have been applied to them
+        self.board = chess.Board(initial_fen)
+        self.chess_state: Optional[ChessState] = None
+        self.plies = 0
+        
+        # Pending search for our next move, if any, and the number of moves
+        # played when the last search was started (so that repeated events
+        # for the same position don't trigger another search)
+        self.future: Optional[Future] = None
+        self.searched_plies = -1
+        
+        # Guards the fields above; each game has its own lock so that
+        # games never wait on each other
+        self.lock = threading.RLock()
+
 
 class LichessBot:
     """
@@ -47,18 +128,38 @@ class LichessBot:
         if not self.token:
             raise ValueError("Lichess API token not provided and LICHESS_API_TOKEN not set in environment")
             
-        # Initialize the Lichess API client
-        self.session = requests.Session()
-        self.session.headers.update({"Authorization": f"Bearer {self.token}"})
+        # Initialize the Lichess API client; berserk shares our session so that
+        # all requests reuse the same pooled keep-alive connections
+        self.session = berserk.TokenSession(self.token)
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE,
+                                                   max_retries=HTTP_RETRIES))
         
         # Initialize berserk client
-        self.client = berserk.Client(berserk.TokenSession(self.token))
+        self.client = berserk.Client(session=self.session)
         
-        # Game state tracking
-        self.current_games = {}
+        # Our Lichess account id, fetched once on first use (see account_id)
+        self._account_id: Optional[str] = None
+        self._account_lock = threading.Lock()
+        
+        # Game state tracking; games_lock only guards adding and removing
+        # entries, each entry has its own lock for its contents
+        self.current_games: Dict[str, GameEntry] = {}
+        self.games_lock = threading.Lock()
+        
+        # Open game streams, shared by realtime games (held for the whole game)
+        # and correspondence polls (held for a single read)
+        self._stream_slots = threading.BoundedSemaphore(MAX_GAME_STREAMS)
         self.accepted_variants = ["standard", "chess960", "crazyhouse", "antichess", "atomic"]
         self.ai_engine = None  # Will be set later
         
+        # Searches run on worker threads so that game streams keep being read meanwhile
+        self._search_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4,
+                                               thread_name_prefix='ai-search')
+        
+        # Best moves of already searched positions by Zobrist hash, least recently used first
+        self.move_cache: OrderedDict = OrderedDict()
+        self.move_cache_lock = threading.Lock()
+        
     def validate_token(self) -> bool:
         """
         Validate that the API token is working.
@@ -68,12 +169,30 @@ class LichessBot:
         """
         try:
             account_info = self.client.account.get()
+            self._account_id = account_info.get('id')
             logger.info(f"Connected to Lichess as: {account_info.get('username', 'Unknown')}")
             return True
         except berserk.exceptions.ResponseError as e:
             logger.error(f"Invalid API token or connection error: {e}")
             return False
             
+    @property
+    def account_id(self) -> str:
+        """
+        Lichess id of the account associated with the token.
+        
+        Fetched from the API on first use and cached afterwards, so that
+        game handling does not cost an extra request per game.
+        
+        Returns:
+            The account id
+        """
+        if self._account_id is None:
+            with self._account_lock:
+                if self._account_id is None:
+                    self._account_id = self.client.account.get()['id']
+        return self._account_id
+        
     def upgrade_to_bot(self) -> bool:
         """
         Upgrade the account associated with the token to a BOT account.
@@ -164,7 +283,7 @@ class LichessBot:
         """
         try:
             self.client.board.make_move(game_id, move)
-            logger.info(f"Made move {move} in game {game_id}")
+            logger.info("Made move %s in game %s", move, game_id)
             return True
         except berserk.exceptions.ResponseError as e:
             logger.error(f"Failed to make move {move} in game {game_id}: {e}")
@@ -211,57 +330,250 @@ class LichessBot:
             logger.info(f"Declining challenge from {opponent} (unsupported variant: {variant})")
             self.decline_challenge(challenge_id, reason="variant")
             
-    def process_game_event(self, event: Dict[str, Any], game_state: Dict[str, Any]) -> None:
+    def process_game_event(self, event: Dict[str, Any], game_state: Dict[str, Any],
+                           game_id: Optional[str] = None) -> None:
         """
         Process a game state event from Lichess.
         
         Args:
             event: Game event data from Lichess
             game_state: Current game state
+            game_id: ID of the game (defaults to game_state['id'])
         """
-        game_id = game_state['id']
+        if game_id is None:
+            game_id = game_state['id']
+        game = self.current_games.get(game_id)
+        if game is None:
+            logger.error(f"Received state for unknown game {game_id}")
+            return
+        
+        # Formatted lazily by the logging module, so this costs nothing unless DEBUG is on
+        logger.debug("Received game state for %s: %s", game_id, game_state)
         
-        # Check if it's our turn
-        if game_state.get('isMyTurn', False):
-            # Convert game state to a chess board
-            board = chess.Board(game_state.get('fen', chess.STARTING_FEN))
+        with game.lock:
+            # Bring the cached position up to date with the moves played so far
+            chess_state = self._sync_game(game, game_state.get('moves', ''))
             
-            # Use AI engine to generate a move
-            if self.ai_engine is not None:
-                try:
-                    # For compatibility with ChessState, we'd need to convert chess.Board to ChessState
-                    # This is a placeholder - actual implementation would depend on AI engine's interface
-                    chess_state = self._convert_to_chess_state(board)
-                    best_move = self.ai_engine.get_best_move(chess_state)
+            # Check if it's our turn (and we haven't already searched this position)
+            if game.board.turn == game.color and game.plies > game.searched_plies:
+                # Use AI engine to generate a move
+                if self.ai_engine is not None:
+                    # The opponent has moved, so stop preparing replies for them
+                    if game.ponder_engine is not None:
+                        game.ponder_engine.stop_event.set()
                     
-                    if best_move:
-                        # Convert move to UCI format
-                        from_x, from_y = best_move[0]
-                        to_x, to_y = best_move[1]
-                        
-                        # Convert to UCI coordinates (e.g., "e2e4")
-                        files = "abcdefgh"
-                        ranks = "12345678"
-                        
-                        uci_move = f"{files[from_x]}{ranks[from_y]}{files[to_x]}{ranks[to_y]}"
-                        self.make_move(game_id, uci_move)
-                    else:
-                        # No legal moves - should mean game is over
-                        logger.info(f"No legal moves in game {game_id}")
-                except Exception as e:
-                    logger.error(f"Error generating or making move: {e}")
-                    # If there's a problem, resign the game
+                    # Search a snapshot, leaving the cached state free to follow the game
+                    game.future = self._search_pool.submit(self._make_ai_move, game_id, game.engine,
+                                                           chess_state.copy())
+                    game.searched_plies = game.plies
+                else:
+                    logger.error("No AI engine connected to generate moves")
                     self.resign_game(game_id)
+            elif (game.board.turn != game.color and game.ponder_engine is not None and
+                    game_state.get('status', 'started') == 'started' and
+                    (game.ponder_future is None or game.ponder_future.done())):
+                # Use the opponent's thinking time to prepare our replies
+                game.ponder_engine.stop_event.clear()
+                game.ponder_future = self._search_pool.submit(self._ponder, game, chess_state.copy(),
+                                                              game.plies)
+                
+    def _ponder(self, game: GameEntry, chess_state: ChessState, plies: int) -> None:
+        """
+        Search our replies to the opponent's most likely moves (runs on a search worker).
+        
+        The opponent's moves are ranked by static evaluation, and the best
+        reply to each of the top PONDER_MOVES is stored in the move cache,
+        so that it can be played immediately if the opponent picks that move.
+        Stops as soon as the opponent actually moves.
+        
+        Args:
+            game: The game's entry
+            chess_state: Position with the opponent to move; owned by this call
+            plies: Number of moves played in that position
+        """
+        engine = game.ponder_engine
+        stop_event = engine.stop_event
+        try:
+            # Rank the opponent's moves by the static evaluation from their point of view
+            evaluate = engine.evaluator.evaluate
+            sign = 1 if chess_state.active_color == PieceColor.WHITE else -1
+            candidates = []
+            for move in chess_state.get_legal_moves():
+                (from_x, from_y), (to_x, to_y) = move
+                undo = chess_state.make_move(from_x, from_y, to_x, to_y)
+                candidates.append((sign * evaluate(chess_state), move))
+                chess_state.unmake_move(from_x, from_y, to_x, to_y, undo)
+            candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+            
+            for _, move in candidates[:PONDER_MOVES]:
+                if stop_event.is_set() or game.plies != plies:
+                    break
+                (from_x, from_y), (to_x, to_y) = move
+                undo = chess_state.make_move(from_x, from_y, to_x, to_y)
+                if chess_state.zobrist not in self.move_cache:
+                    reply = engine.get_best_move(chess_state)
+                    # A search cut short by the opponent's move isn't worth keeping
+                    if reply is not None and not stop_event.is_set():
+                        self._cache_move(chess_state.zobrist, reply)
+                chess_state.unmake_move(from_x, from_y, to_x, to_y, undo)
+        except Exception as e:
+            logger.error(f"Error while pondering: {e}")
+                    
+    def _make_ai_move(self, game_id: str, engine, chess_state: ChessState) -> None:
+        """
+        Search for our move in a game and play it (runs on a search worker).
+        
+        Args:
+            game_id: ID of the game
+            engine: The game's AI engine
+            chess_state: Position to move in; owned by this call
+        """
+        try:
+            best_move = self._get_best_move(engine, chess_state)
+            
+            if best_move:
+                self.make_move(game_id, self._move_to_uci(chess_state, best_move))
             else:
-                logger.error("No AI engine connected to generate moves")
-                self.resign_game(game_id)
+                # No legal moves - should mean game is over
+                logger.info(f"No legal moves in game {game_id}")
+        except Exception as e:
+            logger.error(f"Error generating or making move: {e}")
+            # If there's a problem, resign the game
+            self.resign_game(game_id)
                 
-    def _convert_to_chess_state(self, board: chess.Board):
+    def _get_best_move(self, engine,
+                       chess_state: ChessState) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """
-        Convert python-chess Board to the project's ChessState.
+        Get the AI engine's move for a position, reusing earlier results.
+        
+        Positions that were already searched (e.g. in an earlier game with the
+        same opening) are answered from the move cache without a new search.
+        
+        Args:
+            engine: AI engine to search with if the position isn't cached
+            chess_state: Position to find a move for
+            
+        Returns:
+            Best move as ((from_x, from_y), (to_x, to_y)) tuple, or None if no legal moves
+        """
+        key = chess_state.zobrist
+        with self.move_cache_lock:
+            best_move = self.move_cache.get(key)
+            if best_move is not None:
+                self.move_cache.move_to_end(key)
+                return best_move
+        
+        best_move = engine.get_best_move(chess_state)
+        
+        if best_move is not None:
+            self._cache_move(key, best_move)
+        return best_move
+        
+    def _cache_move(self, key: int, move: Tuple[Tuple[int, int], Tuple[int, int]]) -> None:
+        """
+        Remember the best move of a position, evicting the least recently used if full.
         
-        This is a placeholder method that should be implemented based on
-        the actual ChessState implementation in the project.
+        Args:
+            key: Zobrist hash of the position
+            move: Best move as ((from_x, from_y), (to_x, to_y))
+        """
+        with self.move_cache_lock:
+            self.move_cache[key] = move
+            if len(self.move_cache) > MOVE_CACHE_SIZE:
+                self.move_cache.popitem(last=False)
+        
+    def _move_to_uci(self, chess_state: ChessState,
+                     move: Tuple[Tuple[int, int], Tuple[int, int]]) -> str:
+        """
+        Convert a move from the AI engine to UCI format.
+        
+        Args:
+            chess_state: Position the move is played in
+            move: Move as ((from_x, from_y), (to_x, to_y))
+            
+        Returns:
+            The move in UCI format (e.g., "e2e4", or "e7e8q" for a promotion)
+        """
+        (from_x, from_y), (to_x, to_y) = move
+        from_square = from_y * 8 + from_x
+        to_square = to_y * 8 + to_x
+        uci_move = chess.SQUARE_NAMES[from_square] + chess.SQUARE_NAMES[to_square]
+        
+        # The engine always promotes to a queen
+        if abs(chess_state.squares[from_square]) == 1 and (to_y == 0 or to_y == 7):
+            uci_move += 'q'
+        return uci_move
+        
+    def _start_game(self, game_id: str, game_full: Dict[str, Any]) -> None:
+        """
+        Set up the cached position for a game from its gameFull event.
+        
+        Args:
+            game_id: ID of the game
+            game_full: The gameFull event that starts the game stream
+        """
+        color = chess.WHITE if game_full.get('white', {}).get('id') == self.account_id else chess.BLACK
+        
+        initial_fen = game_full.get('initialFen', 'startpos')
+        if initial_fen == 'startpos':
+            initial_fen = chess.STARTING_FEN
+        
+        # Each game searches with its own engine, sharing the connected
+        # engine's settings, transposition table and worker processes
+        engine = self.ai_engine.spawn() if self.ai_engine is not None else None
+        game = GameEntry(color, initial_fen, engine)
+        game.chess_state = self._convert_to_chess_state(game.board)
+        with self.games_lock:
+            self.current_games[game_id] = game
+        
+    def _sync_game(self, game: GameEntry, moves: str) -> ChessState:
+        """
+        Apply the moves played since the last update to a game's cached position.
+        
+        Only the new moves are applied, so keeping up with a game costs
+        O(1) per move instead of replaying it from the start every turn.
+        The caller must hold the game's lock.
+        
+        Args:
+            game: The game's entry in current_games
+            moves: All moves of the game so far in UCI format, separated by spaces
+            
+        Returns:
+            The game's ChessState, updated to the current position
+        """
+        plies = moves.count(' ') + 1 if moves else 0
+        
+        # Moves were taken back - start over from the initial position
+        if plies < game.plies:
+            game.board = chess.Board(game.initial_fen)
+            game.chess_state = self._convert_to_chess_state(game.board)
+            game.plies = 0
+            game.searched_plies = -1
+        
+        chess_state = game.chess_state
+        if plies == game.plies:
+            return chess_state
+        
+        # Split off only the moves that are new since the last update
+        if game.plies:
+            new_moves = moves.rsplit(' ', plies - game.plies)[1:]
+        else:
+            new_moves = moves.split(' ')
+        
+        board = game.board
+        for uci in new_moves:
+            move = chess.Move.from_uci(uci)
+            promotion = PIECE_TYPE_MAP[move.promotion] if move.promotion else None
+            chess_state.make_move(move.from_square & 7, move.from_square >> 3,
+                                  move.to_square & 7, move.to_square >> 3, promotion)
+            board.push(move)
+        game.plies = plies
+        
+        return chess_state
+        
+    def _convert_to_chess_state(self, board: chess.Board) -> ChessState:
+        """
+        Convert python-chess Board to the project's ChessState.
         
         Args:
             board: A python-chess Board object
@@ -269,9 +581,45 @@ class LichessBot:
         Returns:
             A ChessState object representing the same position
         """
-        # This is a placeholder - actual implementation would depend on ChessState's interface
-        # The implementation would need to set up the board position, active color, castling rights, etc.
-        raise NotImplementedError("This method needs to be implemented based on ChessState's interface")
+        chess_state = ChessState()
+        
+        # Scan the 12 piece bitboards, so every square found is already known
+        # to hold a given piece and no per-square piece_at() lookup is needed.
+        # python-chess numbers squares y * 8 + x from a1, the same as ChessState.squares
+        board_dict = {}
+        squares = array('b', bytes(64))
+        bitboards = [0] * 12
+        for color in chess.COLORS:
+            for piece_type in chess.PIECE_TYPES:
+                mask = board.pieces_mask(piece_type, color)
+                if not mask:
+                    continue
+                # Pieces are never modified in place, so one object serves every square
+                chess_piece = ChessPiece(PIECE_TYPE_MAP[piece_type], COLOR_MAP[color])
+                code = chess_piece.code
+                bitboards[chess_piece.index] = mask
+                for square in chess.scan_forward(mask):
+                    board_dict[(square & 7, square >> 3)] = chess_piece
+                    squares[square] = code
+        chess_state.board = board_dict
+        chess_state.squares = squares
+        chess_state.bitboards = bitboards
+        
+        chess_state.active_color = COLOR_MAP[board.turn]
+        # Castling rights are a mask of the rooks' starting squares
+        castling_rights = board.clean_castling_rights()
+        chess_state.castling_rights = {
+            PieceColor.WHITE: (bool(castling_rights & chess.BB_A1), bool(castling_rights & chess.BB_H1)),
+            PieceColor.BLACK: (bool(castling_rights & chess.BB_A8), bool(castling_rights & chess.BB_H8)),
+        }
+        ep_square = board.ep_square
+        chess_state.en_passant_target = (ep_square & 7, ep_square >> 3) if ep_square is not None else None
+        chess_state.halfmove_clock = board.halfmove_clock
+        chess_state.fullmove_number = board.fullmove_number
+        
+        chess_state.zobrist = chess_state.compute_zobrist()
+        chess_state.phase_material = chess_state.compute_phase_material()
+        return chess_state
         
     def start_bot_loop(self) -> None:
         """
@@ -293,35 +641,121 @@ class LichessBot:
                 elif event['type'] == 'gameStart':
                     # A game has started - we now need to stream the game state
                     game_id = event['game']['id']
+                    correspondence = event['game'].get('speed') == 'correspondence'
                     logger.info(f"Game started: {game_id}")
                     
-                    # Start a new thread to handle this game
-                    # In a production bot, we would use proper threading/async
-                    # This is just a placeholder for demonstration
-                    self._handle_game(game_id)
-        except berserk.exceptions.ResponseError as e:
+                    # Handle each game on its own thread so games are played concurrently
+                    threading.Thread(target=self._handle_game, args=(game_id, correspondence),
+                                     name=f"game-{game_id}", daemon=True).start()
+        except (berserk.exceptions.ApiError, requests.RequestException) as e:
             logger.error(f"Error in bot event loop: {e}")
         except KeyboardInterrupt:
             logger.info("Bot event loop terminated by user")
             
-    def _handle_game(self, game_id: str) -> None:
+    def _handle_game(self, game_id: str, correspondence: bool = False) -> None:
         """
         Handle a single game's events and moves.
         
+        Realtime games hold their stream open for the whole game. Correspondence
+        games can last for weeks, so they are polled instead to keep the number
+        of open streams below Lichess's limit.
+        
         Args:
             game_id: ID of the game to handle
+            correspondence: Whether the game is a correspondence game
         """
         try:
-            # Stream the game state and make moves when it's our turn
-            for game_state in self.client.board.stream_game_state(game_id):
-                self.process_game_event(None, game_state)  # None for event since it's included in game_state
+            if correspondence:
+                self._poll_game(game_id)
+                return
                 
-                # Check if game is over
-                if game_state.get('status') != 'started':
-                    logger.info(f"Game {game_id} ended with status: {game_state.get('status', 'unknown')}")
-                    break
-        except berserk.exceptions.ResponseError as e:
+            if not self._stream_slots.acquire(blocking=False):
+                logger.warning(f"Too many open game streams, waiting to stream game {game_id}")
+                self._stream_slots.acquire()
+            try:
+                # Stream the game state and make moves when it's our turn
+                for event in self.client.board.stream_game_state(game_id):
+                    if self._handle_game_event(game_id, event):
+                        break
+            finally:
+                self._stream_slots.release()
+        except (berserk.exceptions.ApiError, requests.RequestException) as e:
             logger.error(f"Error handling game {game_id}: {e}")
+        finally:
+            with self.games_lock:
+                game = self.current_games.pop(game_id, None)
+            if game is not None:
+                if game.future is not None:
+                    game.future.cancel()
+                if game.ponder_engine is not None:
+                    game.ponder_engine.stop_event.set()
+                    
+    def _poll_game(self, game_id: str) -> None:
+        """
+        Follow a correspondence game by reading its current state periodically.
+        
+        Each poll opens the game stream, handles the gameFull event it starts
+        with and closes the stream again right away.
+        
+        Args:
+            game_id: ID of the game to poll
+        """
+        url = f"https://lichess.org/api/board/game/stream/{game_id}"
+        while True:
+            if self._stream_slots.acquire(blocking=False):
+                try:
+                    with self.session.get(url, stream=True) as response:
+                        if response.ok:
+                            # Skip keep-alive newlines up to the first event
+                            line = next((line for line in response.iter_lines() if line), None)
+                            event = json.loads(line) if line is not None else None
+                        else:
+                            # Most likely transient (rate limit, server error); try again next poll
+                            logger.warning(f"Failed to poll game {game_id}: HTTP {response.status_code}")
+                            event = None
+                except (requests.RequestException, ValueError) as e:
+                    # Connection errors and truncated or garbled events alike
+                    logger.warning(f"Failed to poll game {game_id}: {e}")
+                    event = None
+                finally:
+                    self._stream_slots.release()
+                    
+                if event is not None and self._handle_game_event(game_id, event):
+                    return
+            else:
+                logger.warning(f"Too many open game streams, skipping poll of game {game_id}")
+                
+            time.sleep(CORRESPONDENCE_POLL_INTERVAL)
+            
+    def _handle_game_event(self, game_id: str, event: Dict[str, Any]) -> bool:
+        """
+        Handle one event from a game stream.
+        
+        Args:
+            game_id: ID of the game
+            event: Event data from the game stream
+            
+        Returns:
+            True if the game is over, False otherwise
+        """
+        # The first event describes the whole game, later ones only the current state
+        if event['type'] == 'gameFull':
+            # Polled games receive a gameFull event on every poll
+            if game_id not in self.current_games:
+                self._start_game(game_id, event)
+            game_state = event['state']
+        elif event['type'] == 'gameState':
+            game_state = event
+        else:
+            return False  # Chat lines, opponent gone notices etc.
+            
+        self.process_game_event(event, game_state, game_id)
+        
+        # Check if game is over
+        if game_state.get('status') != 'started':
+            logger.info(f"Game {game_id} ended with status: {game_state.get('status', 'unknown')}")
+            return True
+        return False
 
 
 def create_bot_account():
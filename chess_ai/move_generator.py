@@ -9,6 +9,54 @@ from typing import Dict, List, Tuple, Set
 from .state_manager import ChessState, ChessPiece, PieceType, PieceColor
 
 
+# Piece codes as stored in ChessState.squares (negated for black pieces)
+PAWN_CODE, KNIGHT_CODE, BISHOP_CODE, ROOK_CODE, QUEEN_CODE, KING_CODE = range(1, 7)
+
+
+def _targets(offsets: List[Tuple[int, int]]) -> List[List[int]]:
+    """Return, for every square, the on-board squares reached by the given offsets."""
+    return [
+        [(y + dy) * 8 + x + dx for dx, dy in offsets if 0 <= x + dx < 8 and 0 <= y + dy < 8]
+        for y in range(8) for x in range(8)
+    ]
+
+
+def _rays(directions: List[Tuple[int, int]]) -> List[List[List[int]]]:
+    """Return, for every square, the squares along each direction in order of distance."""
+    rays = []
+    for y in range(8):
+        for x in range(8):
+            square_rays = []
+            for dx, dy in directions:
+                ray = []
+                ray_x, ray_y = x + dx, y + dy
+                while 0 <= ray_x < 8 and 0 <= ray_y < 8:
+                    ray.append(ray_y * 8 + ray_x)
+                    ray_x, ray_y = ray_x + dx, ray_y + dy
+                if ray:
+                    square_rays.append(ray)
+            rays.append(square_rays)
+    return rays
+
+
+# Per-square lookup tables for attack detection, indexed y * 8 + x
+KNIGHT_TARGETS = _targets([(1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)])
+KING_TARGETS = _targets([(1, 0), (0, 1), (-1, 0), (0, -1), (1, 1), (1, -1), (-1, -1), (-1, 1)])
+DIAGONAL_RAYS = _rays([(1, 1), (1, -1), (-1, -1), (-1, 1)])
+ORTHOGONAL_RAYS = _rays([(1, 0), (0, 1), (-1, 0), (0, -1)])
+
+# Single-step "rays" for knights, so they can share the sliding-piece loop
+KNIGHT_RAYS = [[[target] for target in targets] for targets in KNIGHT_TARGETS]
+QUEEN_RAYS = [orthogonal + diagonal for orthogonal, diagonal in zip(ORTHOGONAL_RAYS, DIAGONAL_RAYS)]
+
+# (x, y) coordinates of each square index
+SQUARE_COORDS = [(square % 8, square // 8) for square in range(64)]
+
+# Squares from which a black pawn attacks each square (white pawns attack from below)
+BLACK_PAWN_ATTACKERS = _targets([(-1, 1), (1, 1)])
+WHITE_PAWN_ATTACKERS = _targets([(-1, -1), (1, -1)])
+
+
 class MoveGenerator:
     """
     Generates legal chess moves for a given position.
@@ -39,6 +87,11 @@ class MoveGenerator:
             PieceType.QUEEN: 7,
             PieceType.KING: 1
         }
+        
+        # Precomputed per-square rays for the knight and sliding pieces, indexed by
+        # ChessPiece.index (a tuple rather than a dict keyed by PieceType, since
+        # hashing an Enum member runs Python code)
+        self.rays = (None, KNIGHT_RAYS, DIAGONAL_RAYS, ORTHOGONAL_RAYS, QUEEN_RAYS, None) * 2
     
     def generate_moves(self, state: ChessState) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """
@@ -52,19 +105,60 @@ class MoveGenerator:
         """
         legal_moves = []
         active_color = state.active_color
+        generate_piece_moves = self._generate_piece_moves
         
         # Find all pieces of the active color
-        for (x, y), piece in state.board.items():
+        # (iterate over a snapshot since the legality check makes moves on the board)
+        for (x, y), piece in list(state.board.items()):
             if piece.color != active_color:
                 continue
                 
             # Generate moves for this piece
-            piece_moves = self._generate_piece_moves(state, x, y, piece)
-            legal_moves.extend(piece_moves)
+            legal_moves.extend(generate_piece_moves(state, x, y, piece))
         
         return legal_moves
     
-    def _generate_piece_moves(self, state: ChessState, x: int, y: int, piece: ChessPiece) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    def is_in_check(self, state: ChessState) -> bool:
+        """
+        Determine if the player to move is in check.
+        
+        Args:
+            state: Current chess game state
+            
+        Returns:
+            True if the active player's king is attacked, False otherwise
+        """
+        color = state.active_color
+        king = KING_CODE if color == PieceColor.WHITE else -KING_CODE
+        try:
+            king_square = state.squares.index(king)
+        except ValueError:
+            return False  # No king found (shouldn't happen in a valid chess game)
+        return self._is_square_attacked(state, king_square % 8, king_square // 8, color)
+    
+    def generate_captures(self, state: ChessState) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """
+        Generate all legal capturing moves (including en passant) for the current player.
+        
+        Args:
+            state: Current chess game state
+            
+        Returns:
+            List of legal captures as ((from_x, from_y), (to_x, to_y)) tuples
+        """
+        captures = []
+        active_color = state.active_color
+        
+        for (x, y), piece in list(state.board.items()):
+            if piece.color != active_color:
+                continue
+                
+            captures.extend(self._generate_piece_moves(state, x, y, piece, captures_only=True))
+        
+        return captures
+    
+    def _generate_piece_moves(self, state: ChessState, x: int, y: int, piece: ChessPiece,
+                              captures_only: bool = False) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """
         Generate legal moves for a specific piece.
         
@@ -73,6 +167,7 @@ class MoveGenerator:
             x: File (column) coordinate of the piece
             y: Rank (row) coordinate of the piece
             piece: The chess piece to generate moves for
+            captures_only: Only return capturing moves
             
         Returns:
             List of legal moves for the piece as ((from_x, from_y), (to_x, to_y)) tuples
@@ -87,66 +182,66 @@ class MoveGenerator:
             moves.extend(self._generate_king_moves(state, x, y, piece))
         else:
             # Handle sliding pieces (knight, bishop, rook, queen)
-            directions = self.directions[piece.piece_type]
-            max_distance = self.max_distance[piece.piece_type]
+            squares = state.squares
+            code = piece.code
             
-            for dx, dy in directions:
-                for dist in range(1, max_distance + 1):
-                    new_x, new_y = x + dx * dist, y + dy * dist
-                    
-                    # Check if position is on the board
-                    if not (0 <= new_x < 8 and 0 <= new_y < 8):
-                        break
-                        
-                    to_pos = (new_x, new_y)
-                    target_piece = state.get_piece_at(new_x, new_y)
+            for ray in self.rays[piece.index][y * 8 + x]:
+                for square in ray:
+                    target = squares[square]
                     
-                    if target_piece is None:
+                    if target == 0:
                         # Empty square - valid move
-                        moves.append((from_pos, to_pos))
-                    elif target_piece.color != piece.color:
+                        moves.append((from_pos, SQUARE_COORDS[square]))
+                    elif (target > 0) != (code > 0):
                         # Enemy piece - can capture
-                        moves.append((from_pos, to_pos))
+                        moves.append((from_pos, SQUARE_COORDS[square]))
                         break  # Can't move further in this direction
                     else:
                         # Friendly piece - blocked
                         break
         
+        # Drop quiet moves before the (comparatively expensive) legality check
+        if captures_only:
+            board = state.board
+            en_passant_target = state.en_passant_target if piece.piece_type == PieceType.PAWN else None
+            moves = [
+                move for move in moves
+                if move[1] in board or (move[1] == en_passant_target and move[1][0] != x)
+            ]
+        
         # Filter out moves that would leave the king in check
-        legal_moves = []
-        for move in moves:
-            if not self._would_be_in_check_after_move(state, move):
-                legal_moves.append(move)
-                
-        return legal_moves
+        would_be_in_check = self._would_be_in_check_after_move
+        return [move for move in moves if not would_be_in_check(state, move)]
     
     def _generate_pawn_moves(self, state: ChessState, x: int, y: int, piece: ChessPiece) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """Generate legal moves for a pawn."""
         moves = []
         from_pos = (x, y)
+        squares = state.squares
         
         # Determine direction based on color
+        # (the sign of a piece code times direction is positive for own pieces)
         direction = 1 if piece.color == PieceColor.WHITE else -1
         
         # Forward move
         new_y = y + direction
-        if 0 <= new_y < 8 and state.get_piece_at(x, new_y) is None:
+        if 0 <= new_y < 8 and squares[new_y * 8 + x] == 0:
             moves.append((from_pos, (x, new_y)))
             
             # Double move from starting position
-            if (y == 1 and piece.color == PieceColor.WHITE) or (y == 6 and piece.color == PieceColor.BLACK):
+            if (y == 1 and direction == 1) or (y == 6 and direction == -1):
                 new_y = y + 2 * direction
-                if 0 <= new_y < 8 and state.get_piece_at(x, new_y) is None:
+                if squares[new_y * 8 + x] == 0:
                     moves.append((from_pos, (x, new_y)))
         
         # Captures
-        for dx in [-1, 1]:
+        for dx in (-1, 1):
             new_x, new_y = x + dx, y + direction
             if 0 <= new_x < 8 and 0 <= new_y < 8:
-                target_piece = state.get_piece_at(new_x, new_y)
+                target = squares[new_y * 8 + new_x]
                 
                 # Regular capture
-                if target_piece is not None and target_piece.color != piece.color:
+                if target * direction < 0:
                     moves.append((from_pos, (new_x, new_y)))
                 
                 # En passant capture
@@ -159,43 +254,39 @@ class MoveGenerator:
         """Generate legal moves for a king, including castling."""
         moves = []
         from_pos = (x, y)
+        squares = state.squares
+        code = piece.code
         
         # Regular king moves
-        for dx, dy in self.directions[PieceType.KING]:
-            new_x, new_y = x + dx, y + dy
-            
-            # Check if position is on the board
-            if not (0 <= new_x < 8 and 0 <= new_y < 8):
-                continue
-                
-            to_pos = (new_x, new_y)
-            target_piece = state.get_piece_at(new_x, new_y)
+        for square in KING_TARGETS[y * 8 + x]:
+            target = squares[square]
             
-            if target_piece is None or target_piece.color != piece.color:
+            if target == 0 or (target > 0) != (code > 0):
                 # Empty square or enemy piece - valid move
-                moves.append((from_pos, to_pos))
+                moves.append((from_pos, SQUARE_COORDS[square]))
         
         # Castling
-        if not state.is_check():  # Can't castle out of check
-            queenside, kingside = state.castling_rights[piece.color]
-            
-            # Kingside castling
-            if kingside:
-                if self._can_castle_kingside(state, x, y, piece.color):
-                    moves.append((from_pos, (x + 2, y)))
-            
-            # Queenside castling
-            if queenside:
-                if self._can_castle_queenside(state, x, y, piece.color):
-                    moves.append((from_pos, (x - 2, y)))
+        # (castling out of check is excluded by the attack test on the king's own square)
+        queenside, kingside = state.castling_rights[piece.color]
+        
+        # Kingside castling
+        if kingside:
+            if self._can_castle_kingside(state, x, y, piece.color):
+                moves.append((from_pos, (x + 2, y)))
+        
+        # Queenside castling
+        if queenside:
+            if self._can_castle_queenside(state, x, y, piece.color):
+                moves.append((from_pos, (x - 2, y)))
         
         return moves
     
     def _can_castle_kingside(self, state: ChessState, x: int, y: int, color: PieceColor) -> bool:
         """Check if kingside castling is legal."""
         # Check squares between king and rook are empty
+        squares = state.squares
         for i in range(1, 3):
-            if state.get_piece_at(x + i, y) is not None:
+            if squares[y * 8 + x + i]:
                 return False
                 
         # Check if squares are under attack
@@ -208,8 +299,9 @@ class MoveGenerator:
     def _can_castle_queenside(self, state: ChessState, x: int, y: int, color: PieceColor) -> bool:
         """Check if queenside castling is legal."""
         # Check squares between king and rook are empty
+        squares = state.squares
         for i in range(1, 4):
-            if state.get_piece_at(x - i, y) is not None:
+            if squares[y * 8 + x - i]:
                 return False
                 
         # Check if squares are under attack
@@ -232,69 +324,55 @@ class MoveGenerator:
         Returns:
             True if the square is attacked, False otherwise
         """
-        opponent_color = PieceColor.BLACK if color == PieceColor.WHITE else PieceColor.WHITE
+        squares = state.squares
+        square = y * 8 + x
+        
+        # Attacking pieces have the opposite sign to the defending color
+        if color == PieceColor.WHITE:
+            sign = -1
+            pawn_attackers = BLACK_PAWN_ATTACKERS
+        else:
+            sign = 1
+            pawn_attackers = WHITE_PAWN_ATTACKERS
         
         # Check for pawn attacks
-        pawn_direction = -1 if color == PieceColor.WHITE else 1  # Direction pawns attack from
-        for dx in [-1, 1]:
-            attack_x, attack_y = x + dx, y + pawn_direction
-            if 0 <= attack_x < 8 and 0 <= attack_y < 8:
-                piece = state.get_piece_at(attack_x, attack_y)
-                if (piece is not None and 
-                    piece.color == opponent_color and 
-                    piece.piece_type == PieceType.PAWN):
-                    return True
+        pawn = sign * PAWN_CODE
+        for attacker in pawn_attackers[square]:
+            if squares[attacker] == pawn:
+                return True
                     
         # Check for knight attacks
-        knight_moves = self.directions[PieceType.KNIGHT]
-        for dx, dy in knight_moves:
-            attack_x, attack_y = x + dx, y + dy
-            if 0 <= attack_x < 8 and 0 <= attack_y < 8:
-                piece = state.get_piece_at(attack_x, attack_y)
-                if (piece is not None and 
-                    piece.color == opponent_color and 
-                    piece.piece_type == PieceType.KNIGHT):
-                    return True
+        knight = sign * KNIGHT_CODE
+        for attacker in KNIGHT_TARGETS[square]:
+            if squares[attacker] == knight:
+                return True
         
         # Check for king attacks (for adjacent squares)
-        king_moves = self.directions[PieceType.KING]
-        for dx, dy in king_moves:
-            attack_x, attack_y = x + dx, y + dy
-            if 0 <= attack_x < 8 and 0 <= attack_y < 8:
-                piece = state.get_piece_at(attack_x, attack_y)
-                if (piece is not None and 
-                    piece.color == opponent_color and 
-                    piece.piece_type == PieceType.KING):
-                    return True
+        king = sign * KING_CODE
+        for attacker in KING_TARGETS[square]:
+            if squares[attacker] == king:
+                return True
         
         # Check for sliding piece attacks (bishop, rook, queen)
+        queen = sign * QUEEN_CODE
+        
         # Diagonal directions (bishop, queen)
-        diagonal_dirs = self.directions[PieceType.BISHOP]
-        for dx, dy in diagonal_dirs:
-            for dist in range(1, 8):
-                attack_x, attack_y = x + dx * dist, y + dy * dist
-                if not (0 <= attack_x < 8 and 0 <= attack_y < 8):
-                    break  # Off the board
-                    
-                piece = state.get_piece_at(attack_x, attack_y)
-                if piece is not None:
-                    if (piece.color == opponent_color and 
-                        (piece.piece_type == PieceType.BISHOP or piece.piece_type == PieceType.QUEEN)):
+        bishop = sign * BISHOP_CODE
+        for ray in DIAGONAL_RAYS[square]:
+            for attacker in ray:
+                piece = squares[attacker]
+                if piece:
+                    if piece == bishop or piece == queen:
                         return True
                     break  # Blocked by a piece
         
         # Orthogonal directions (rook, queen)
-        orthogonal_dirs = self.directions[PieceType.ROOK]
-        for dx, dy in orthogonal_dirs:
-            for dist in range(1, 8):
-                attack_x, attack_y = x + dx * dist, y + dy * dist
-                if not (0 <= attack_x < 8 and 0 <= attack_y < 8):
-                    break  # Off the board
-                    
-                piece = state.get_piece_at(attack_x, attack_y)
-                if piece is not None:
-                    if (piece.color == opponent_color and 
-                        (piece.piece_type == PieceType.ROOK or piece.piece_type == PieceType.QUEEN)):
+        rook = sign * ROOK_CODE
+        for ray in ORTHOGONAL_RAYS[square]:
+            for attacker in ray:
+                piece = squares[attacker]
+                if piece:
+                    if piece == rook or piece == queen:
                         return True
                     break  # Blocked by a piece
         
@@ -304,6 +382,9 @@ class MoveGenerator:
         """
         Determine if making a move would leave the king in check.
         
+        The move is made on the given state and taken back again before
+        returning, so the state is left unchanged.
+        
         Args:
             state: Current chess state
             move: Move to evaluate as ((from_x, from_y), (to_x, to_y))
@@ -311,59 +392,20 @@ class MoveGenerator:
         Returns:
             True if the move would leave the king in check, False otherwise
         """
-        # Create a deep copy of the state
-        new_state = self._copy_state(state)
-        
-        # Apply the move
-        from_pos, to_pos = move
-        from_x, from_y = from_pos
-        to_x, to_y = to_pos
-        
-        piece = new_state.board.pop((from_x, from_y))
-        new_state.board[(to_x, to_y)] = piece
-        
-        # Find the king's position
-        king_pos = None
-        for pos, p in new_state.board.items():
-            if p.piece_type == PieceType.KING and p.color == state.active_color:
-                king_pos = pos
-                break
-        
-        if king_pos is None:
-            return False  # No king found (shouldn't happen in a valid chess game)
-            
-        # Check if the king's position is under attack
-        king_x, king_y = king_pos
-        return self._is_square_attacked(new_state, king_x, king_y, state.active_color)
-    
-    def _copy_state(self, state: ChessState) -> ChessState:
-        """
-        Create a deep copy of a chess state for move validation.
-        
-        This is a simplified copy that only copies the board and active color,
-        which is sufficient for move validation.
-        
-        Args:
-            state: The state to copy
-            
-        Returns:
-            A new ChessState with copied data
-        """
-        new_state = ChessState()
-        
-        # Copy board positions (most important for move validation)
-        new_state.board = state.board.copy()
-        
-        # Copy active color
-        new_state.active_color = state.active_color
-        
-        # Copy en passant target
-        new_state.en_passant_target = state.en_passant_target
-        
-        # Copy castling rights
-        new_state.castling_rights = {
-            color: rights[:] for color, rights in state.castling_rights.items()
-        }
-        
-        return new_state
+        (from_x, from_y), (to_x, to_y) = move
+        color = state.active_color
+        
+        undo = state.make_move(from_x, from_y, to_x, to_y)
+        try:
+            # Find the king's position
+            king = KING_CODE if color == PieceColor.WHITE else -KING_CODE
+            try:
+                king_square = state.squares.index(king)
+            except ValueError:
+                return False  # No king found (shouldn't happen in a valid chess game)
+                
+            # Check if the king's position is under attack
+            return self._is_square_attacked(state, king_square % 8, king_square // 8, color)
+        finally:
+            state.unmake_move(from_x, from_y, to_x, to_y, undo)
 
@@ -6,8 +6,11 @@ including the board, pieces, and game rules.
 """
 
 import enum
+from array import array
 from typing import Dict, List, Optional, Tuple, Set
 
+from . import zobrist
+
 
 class PieceType(enum.Enum):
     """Chess piece types."""
@@ -25,6 +28,18 @@ class PieceColor(enum.Enum):
     BLACK = 'b'
 
 
+# Order of piece types used for per-piece lookup tables (Zobrist keys etc.)
+PIECE_TYPE_ORDER = (
+    PieceType.PAWN, PieceType.KNIGHT, PieceType.BISHOP,
+    PieceType.ROOK, PieceType.QUEEN, PieceType.KING
+)
+
+
+# Material of each piece in centipawns for telling the game phase (matching
+# PositionEvaluator.piece_values, with kings left out), by ChessPiece.index
+PHASE_MATERIAL = (100, 320, 330, 500, 900, 0) * 2
+
+
 class ChessPiece:
     """Represents a chess piece."""
     
@@ -39,6 +54,12 @@ class ChessPiece:
         self.piece_type = piece_type
         self.color = color
         
+        # Index into 12-entry per-piece tables (0-5 white, 6-11 black)
+        self.index = PIECE_TYPE_ORDER.index(piece_type) + (0 if color == PieceColor.WHITE else 6)
+        
+        # Signed code used in ChessState.squares (1-6 white, -1 to -6 black)
+        self.code = (PIECE_TYPE_ORDER.index(piece_type) + 1) * (1 if color == PieceColor.WHITE else -1)
+        
     def __str__(self) -> str:
         """Return string representation of the piece."""
         char = self.piece_type.value
@@ -49,6 +70,13 @@ class ChessPiece:
         return f"ChessPiece({self.piece_type}, {self.color})"
 
 
+# Information needed to take back a move:
+# (moved piece, captured piece, captured square, castling rights,
+#  en passant target, halfmove clock, Zobrist hash)
+UndoInfo = Tuple[ChessPiece, Optional[ChessPiece], Tuple[int, int],
+                 Dict[PieceColor, Tuple[bool, bool]], Optional[Tuple[int, int]], int, int]
+
+
 class ChessState:
     """
     Represents the state of a chess game.
@@ -63,6 +91,15 @@ class ChessState:
         # (0, 0) is bottom-left (a1), (7, 7) is top-right (h8)
         self.board: Dict[Tuple[int, int], ChessPiece] = {}
         
+        # Mirror of the board as 64 signed bytes indexed y * 8 + x, holding
+        # ChessPiece.code for occupied squares and 0 for empty ones, so that
+        # hot loops (e.g. attack detection) can work on plain integers
+        self.squares = array('b', bytes(64))
+        
+        # One bitboard per piece, indexed by ChessPiece.index, with bit y * 8 + x
+        # set for every square holding that piece (used for fast evaluation)
+        self.bitboards: List[int] = [0] * 12
+        
         # Game state variables
         self.active_color: PieceColor = PieceColor.WHITE
         self.castling_rights: Dict[PieceColor, Tuple[bool, bool]] = {
@@ -78,6 +115,19 @@ class ChessState:
         
         # Setup the initial board position
         self._setup_initial_position()
+        
+        # Zobrist hash of the position, kept up to date by make_move/unmake_move
+        self.zobrist: int = self.compute_zobrist()
+        
+        # Total non-king material on the board (see PHASE_MATERIAL), also kept
+        # up to date by make_move/unmake_move
+        self.phase_material: int = self.compute_phase_material()
+        
+        # (Zobrist hash, legal moves, in check) of the last position queried
+        self._legal_cache: Optional[Tuple[int, List[Tuple[Tuple[int, int], Tuple[int, int]]], bool]] = None
+        
+        # ((Zobrist hash, halfmove clock, fullmove number), FEN) of the last position queried
+        self._fen_cache: Optional[Tuple[Tuple[int, int, int], str]] = None
     
     def _setup_initial_position(self) -> None:
         """Set up the initial chess position."""
@@ -95,6 +145,76 @@ class ChessState:
         for x, piece_type in enumerate(back_rank):
             self.board[(x, 0)] = ChessPiece(piece_type, PieceColor.WHITE)
             self.board[(x, 7)] = ChessPiece(piece_type, PieceColor.BLACK)
+            
+        for (x, y), piece in self.board.items():
+            self.squares[y * 8 + x] = piece.code
+            self.bitboards[piece.index] |= 1 << (y * 8 + x)
+    
+    def _castling_mask(self) -> int:
+        """Return the castling rights as a 4-bit mask (see zobrist.CASTLE)."""
+        white_queenside, white_kingside = self.castling_rights[PieceColor.WHITE]
+        black_queenside, black_kingside = self.castling_rights[PieceColor.BLACK]
+        return (
+            (1 if white_kingside else 0) |
+            (2 if white_queenside else 0) |
+            (4 if black_kingside else 0) |
+            (8 if black_queenside else 0)
+        )
+    
+    def copy(self) -> 'ChessState':
+        """
+        Create an independent copy of this state.
+        
+        Pieces are never modified in place, so they are shared with the copy.
+        
+        Returns:
+            A new ChessState representing the same position
+        """
+        state = ChessState.__new__(ChessState)
+        state.board = dict(self.board)
+        state.squares = array('b', self.squares)
+        state.bitboards = list(self.bitboards)
+        state.active_color = self.active_color
+        state.castling_rights = self.castling_rights  # Replaced, never mutated, by make_move
+        state.en_passant_target = self.en_passant_target
+        state.halfmove_clock = self.halfmove_clock
+        state.fullmove_number = self.fullmove_number
+        state.move_history = list(self.move_history)
+        state.zobrist = self.zobrist
+        state.phase_material = self.phase_material
+        state._legal_cache = None
+        state._fen_cache = self._fen_cache
+        return state
+    
+    def compute_zobrist(self) -> int:
+        """
+        Compute the Zobrist hash of the current position from scratch.
+        
+        Returns:
+            64-bit hash of pieces, side to move, castling rights and en passant file
+        """
+        h = 0
+        for (x, y), piece in self.board.items():
+            h ^= zobrist.PIECE_SQUARE[piece.index][y * 8 + x]
+        
+        if self.active_color == PieceColor.BLACK:
+            h ^= zobrist.SIDE
+            
+        h ^= zobrist.CASTLE[self._castling_mask()]
+        
+        if self.en_passant_target is not None:
+            h ^= zobrist.EP_FILE[self.en_passant_target[0]]
+            
+        return h
+    
+    def compute_phase_material(self) -> int:
+        """
+        Compute the total non-king material on the board from scratch.
+        
+        Returns:
+            Sum of PHASE_MATERIAL over all pieces
+        """
+        return sum(PHASE_MATERIAL[piece.index] for piece in self.board.values())
     
     def get_piece_at(self, x: int, y: int) -> Optional[ChessPiece]:
         """
@@ -129,10 +249,14 @@ class ChessState:
         # - Special rules like castling, en passant, etc.
         return True
     
-    def make_move(self, from_x: int, from_y: int, to_x: int, to_y: int, promotion: Optional[PieceType] = None) -> bool:
+    def make_move(self, from_x: int, from_y: int, to_x: int, to_y: int,
+                  promotion: Optional[PieceType] = None) -> Optional[UndoInfo]:
         """
         Make a chess move if it's valid.
         
+        The board is updated in place; the returned undo information can be
+        passed to unmake_move to restore the previous position exactly.
+        
         Args:
             from_x: Starting file coordinate
             from_y: Starting rank coordinate
@@ -141,22 +265,99 @@ class ChessState:
             promotion: Piece type to promote to (if move is a pawn promotion)
             
         Returns:
-            True if the move was made, False if invalid
+            Undo information for unmake_move if the move was made, None if invalid
         """
         if not self.is_valid_move(from_x, from_y, to_x, to_y):
-            return False
+            return None
+        
+        board = self.board
+        squares = self.squares
+        bitboards = self.bitboards
+        piece = board.pop((from_x, from_y))
+        piece_type = piece.piece_type
+        
+        # En passant captures the pawn beside the target square, not on it
+        captured_pos = (to_x, to_y)
+        if (piece_type == PieceType.PAWN and from_x != to_x and
+                self.en_passant_target == captured_pos and captured_pos not in board):
+            captured_pos = (to_x, from_y)
+        captured = board.pop(captured_pos, None)
+        squares[from_y * 8 + from_x] = 0
+        squares[captured_pos[1] * 8 + captured_pos[0]] = 0
+        bitboards[piece.index] ^= 1 << (from_y * 8 + from_x)
+        if captured is not None:
+            bitboards[captured.index] ^= 1 << (captured_pos[1] * 8 + captured_pos[0])
+        
+        # Pawns reaching the last rank are promoted (to a queen unless specified)
+        placed = piece
+        if piece_type == PieceType.PAWN and (to_y == 0 or to_y == 7):
+            placed = ChessPiece(promotion or PieceType.QUEEN, piece.color)
+        board[(to_x, to_y)] = placed
+        squares[to_y * 8 + to_x] = placed.code
+        bitboards[placed.index] ^= 1 << (to_y * 8 + to_x)
+        
+        undo = (piece, captured, captured_pos, self.castling_rights,
+                self.en_passant_target, self.halfmove_clock, self.zobrist)
+        
+        # Update the Zobrist hash incrementally
+        h = (self.zobrist ^
+             zobrist.PIECE_SQUARE[piece.index][from_y * 8 + from_x] ^
+             zobrist.PIECE_SQUARE[placed.index][to_y * 8 + to_x])
+        if captured is not None:
+            h ^= zobrist.PIECE_SQUARE[captured.index][captured_pos[1] * 8 + captured_pos[0]]
+            self.phase_material -= PHASE_MATERIAL[captured.index]
+        if placed is not piece:
+            self.phase_material += PHASE_MATERIAL[placed.index] - PHASE_MATERIAL[piece.index]
+        
+        # Castling also moves the rook
+        if piece_type == PieceType.KING and abs(to_x - from_x) == 2:
+            rook_from, rook_to = (7, 5) if to_x > from_x else (0, 3)
+            rook = board.pop((rook_from, from_y))
+            board[(rook_to, from_y)] = rook
+            squares[from_y * 8 + rook_from] = 0
+            squares[from_y * 8 + rook_to] = rook.code
+            bitboards[rook.index] ^= (1 << (from_y * 8 + rook_from)) | (1 << (from_y * 8 + rook_to))
+            rook_keys = zobrist.PIECE_SQUARE[rook.index]
+            h ^= rook_keys[from_y * 8 + rook_from] ^ rook_keys[from_y * 8 + rook_to]
         
-        # This is a simplified version - a full implementation would:
-        # - Update the board state
-        # - Handle captures
-        # - Update castling rights
-        # - Handle special moves (castling, en passant, promotion)
-        # - Update game state variables
-        # - Check for game end conditions
+        # Moving a king or rook off its home square (or capturing a rook there)
+        # loses the corresponding castling rights
+        if from_y in (0, 7) or to_y in (0, 7):
+            rights = dict(self.castling_rights)
+            for x, y in ((from_x, from_y), (to_x, to_y)):
+                if y != 0 and y != 7:
+                    continue
+                color = PieceColor.WHITE if y == 0 else PieceColor.BLACK
+                queenside, kingside = rights[color]
+                if x == 4:
+                    queenside = kingside = False
+                elif x == 0:
+                    queenside = False
+                elif x == 7:
+                    kingside = False
+                rights[color] = (queenside, kingside)
+            if rights != self.castling_rights:
+                old_mask = self._castling_mask()
+                # Replace rather than mutate so the undo record keeps the old rights
+                self.castling_rights = rights
+                h ^= zobrist.CASTLE[old_mask] ^ zobrist.CASTLE[self._castling_mask()]
         
-        # Example basic move implementation:
-        piece = self.board.pop((from_x, from_y))
-        self.board[(to_x, to_y)] = piece
+        # A double pawn push makes the skipped square an en passant target
+        if self.en_passant_target is not None:
+            h ^= zobrist.EP_FILE[self.en_passant_target[0]]
+        if piece_type == PieceType.PAWN and abs(to_y - from_y) == 2:
+            self.en_passant_target = (from_x, (from_y + to_y) // 2)
+            h ^= zobrist.EP_FILE[from_x]
+        else:
+            self.en_passant_target = None
+        
+        self.zobrist = h ^ zobrist.SIDE
+        
+        # Pawn moves and captures reset the fifty-move counter
+        if piece_type == PieceType.PAWN or captured is not None:
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
         
         # Switch active color
         self.active_color = (
@@ -172,7 +373,123 @@ class ChessState:
         move_text = f"{chr(97 + from_x)}{from_y + 1}{chr(97 + to_x)}{to_y + 1}"
         self.move_history.append(move_text)
         
-        return True
+        return undo
+    
+    def unmake_move(self, from_x: int, from_y: int, to_x: int, to_y: int, undo: UndoInfo) -> None:
+        """
+        Take back a move previously made with make_move.
+        
+        Args:
+            from_x: Starting file coordinate of the move
+            from_y: Starting rank coordinate of the move
+            to_x: Target file coordinate of the move
+            to_y: Target rank coordinate of the move
+            undo: The undo information returned by make_move
+        """
+        piece, captured, captured_pos, castling_rights, en_passant_target, halfmove_clock, h = undo
+        board = self.board
+        squares = self.squares
+        bitboards = self.bitboards
+        
+        placed = board.pop((to_x, to_y))
+        board[(from_x, from_y)] = piece
+        squares[to_y * 8 + to_x] = 0
+        squares[from_y * 8 + from_x] = piece.code
+        bitboards[placed.index] ^= 1 << (to_y * 8 + to_x)
+        bitboards[piece.index] ^= 1 << (from_y * 8 + from_x)
+        if captured is not None:
+            board[captured_pos] = captured
+            squares[captured_pos[1] * 8 + captured_pos[0]] = captured.code
+            bitboards[captured.index] ^= 1 << (captured_pos[1] * 8 + captured_pos[0])
+            self.phase_material += PHASE_MATERIAL[captured.index]
+        if placed is not piece:
+            self.phase_material -= PHASE_MATERIAL[placed.index] - PHASE_MATERIAL[piece.index]
+        
+        if piece.piece_type == PieceType.KING and abs(to_x - from_x) == 2:
+            rook_from, rook_to = (7, 5) if to_x > from_x else (0, 3)
+            rook = board.pop((rook_to, from_y))
+            board[(rook_from, from_y)] = rook
+            squares[from_y * 8 + rook_to] = 0
+            squares[from_y * 8 + rook_from] = rook.code
+            bitboards[rook.index] ^= (1 << (from_y * 8 + rook_from)) | (1 << (from_y * 8 + rook_to))
+        
+        self.castling_rights = castling_rights
+        self.en_passant_target = en_passant_target
+        self.halfmove_clock = halfmove_clock
+        self.zobrist = h
+        
+        if self.active_color == PieceColor.WHITE:
+            self.fullmove_number -= 1
+        self.active_color = piece.color
+        
+        self.move_history.pop()
+    
+    def push_null(self) -> Tuple[Optional[Tuple[int, int]], int]:
+        """
+        Pass the turn to the opponent without moving (a "null move").
+        
+        Used by the search for null-move pruning; must be undone with pop_null.
+        
+        Returns:
+            Undo information for pop_null
+        """
+        undo = (self.en_passant_target, self.zobrist)
+        
+        h = self.zobrist ^ zobrist.SIDE
+        if self.en_passant_target is not None:
+            h ^= zobrist.EP_FILE[self.en_passant_target[0]]
+            self.en_passant_target = None
+        self.zobrist = h
+        
+        self.active_color = (
+            PieceColor.BLACK if self.active_color == PieceColor.WHITE else PieceColor.WHITE
+        )
+        return undo
+    
+    def pop_null(self, undo: Tuple[Optional[Tuple[int, int]], int]) -> None:
+        """
+        Take back a null move made with push_null.
+        
+        Args:
+            undo: The undo information returned by push_null
+        """
+        self.en_passant_target, self.zobrist = undo
+        self.active_color = (
+            PieceColor.BLACK if self.active_color == PieceColor.WHITE else PieceColor.WHITE
+        )
+    
+    def has_non_pawn_material(self, color: PieceColor) -> bool:
+        """
+        Check whether a side has any pieces other than pawns and its king.
+        
+        Args:
+            color: The side to check
+            
+        Returns:
+            True if the side has at least one knight, bishop, rook or queen
+        """
+        # Knight to queen have codes 2-5 (negated for black)
+        if color == PieceColor.WHITE:
+            return any(2 <= code <= 5 for code in self.squares)
+        return any(-5 <= code <= -2 for code in self.squares)
+    
+    def _legal_move_info(self) -> Tuple[List[Tuple[Tuple[int, int], Tuple[int, int]]], bool]:
+        """
+        Generate the legal moves and check status for the current position.
+        
+        The result is cached per position (by Zobrist hash), so the usual
+        sequence of is_check/is_checkmate/is_stalemate calls after a move
+        only generates moves once.
+        
+        Returns:
+            Tuple of (legal moves, whether the current player is in check)
+        """
+        if self._legal_cache is None or self._legal_cache[0] != self.zobrist:
+            # Imported here since the move generator itself depends on this module
+            from .move_generator import MoveGenerator
+            generator = MoveGenerator()
+            self._legal_cache = (self.zobrist, generator.generate_moves(self), generator.is_in_check(self))
+        return self._legal_cache[1], self._legal_cache[2]
     
     def is_check(self) -> bool:
         """
@@ -181,8 +498,7 @@ class ChessState:
         Returns:
             True if the current player is in check, False otherwise
         """
-        # Implementation will check if any opponent piece can capture the king
-        return False
+        return self._legal_move_info()[1]
     
     def is_checkmate(self) -> bool:
         """
@@ -191,10 +507,8 @@ class ChessState:
         Returns:
             True if the current player is in checkmate, False otherwise
         """
-        # Implementation will check if:
-        # 1. The king is in check
-        # 2. There are no legal moves that get out of check
-        return False
+        legal_moves, in_check = self._legal_move_info()
+        return in_check and not legal_moves
     
     def is_stalemate(self) -> bool:
         """
@@ -203,20 +517,96 @@ class ChessState:
         Returns:
             True if the current player has no legal moves but is not in check
         """
-        # Implementation will check if:
-        # 1. The king is not in check
-        # 2. There are no legal moves
-        return False
+        legal_moves, in_check = self._legal_move_info()
+        return not in_check and not legal_moves
+    
+    def status(self) -> Tuple[bool, bool, bool]:
+        """
+        Determine check, checkmate and stalemate together.
+        
+        Returns:
+            Tuple of (is_check, is_checkmate, is_stalemate) for the current player
+        """
+        legal_moves, in_check = self._legal_move_info()
+        return in_check, in_check and not legal_moves, not in_check and not legal_moves
+    
+    def game_result(self) -> Optional[str]:
+        """
+        Determine whether the game has ended in the current position.
+        
+        Checkmate and stalemate share one (cached) legal move generation;
+        draws by the fifty-move rule and insufficient material are read from
+        the move clock and bitboards. Repetition isn't detected, as past
+        positions aren't kept.
+        
+        Returns:
+            "checkmate", "stalemate", "fifty_move_rule" or "insufficient_material"
+            if the game is over, otherwise None
+        """
+        legal_moves, in_check = self._legal_move_info()
+        if not legal_moves:
+            return "checkmate" if in_check else "stalemate"
+        
+        if self.halfmove_clock >= 100:
+            return "fifty_move_rule"
+        
+        # No pawns, rooks or queens, and at most one knight or bishop on the board
+        bitboards = self.bitboards
+        if not (bitboards[0] | bitboards[3] | bitboards[4] | bitboards[6] | bitboards[9] | bitboards[10]):
+            minor_pieces = bitboards[1] | bitboards[2] | bitboards[7] | bitboards[8]
+            if minor_pieces & (minor_pieces - 1) == 0:
+                return "insufficient_material"
+        
+        return None
     
     def get_fen(self) -> str:
         """
         Get the Forsyth-Edwards Notation (FEN) representation of the current position.
         
+        The result is cached per position (by Zobrist hash and move counters),
+        so repeated calls between moves don't rescan the board.
+        
         Returns:
             FEN string representation of the position
         """
-        # This is a placeholder - full FEN implementation would be needed
-        return "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+        key = (self.zobrist, self.halfmove_clock, self.fullmove_number)
+        if self._fen_cache is not None and self._fen_cache[0] == key:
+            return self._fen_cache[1]
+        
+        # Piece placement, from the 8th rank down, with runs of empty squares as digits
+        ranks = []
+        for y in range(7, -1, -1):
+            rank = ""
+            empty = 0
+            for x in range(8):
+                piece = self.board.get((x, y))
+                if piece is None:
+                    empty += 1
+                    continue
+                if empty:
+                    rank += str(empty)
+                    empty = 0
+                rank += str(piece)
+            if empty:
+                rank += str(empty)
+            ranks.append(rank)
+        
+        white_queenside, white_kingside = self.castling_rights[PieceColor.WHITE]
+        black_queenside, black_kingside = self.castling_rights[PieceColor.BLACK]
+        castling = (
+            ("K" if white_kingside else "") + ("Q" if white_queenside else "") +
+            ("k" if black_kingside else "") + ("q" if black_queenside else "")
+        ) or "-"
+        
+        if self.en_passant_target is None:
+            en_passant = "-"
+        else:
+            en_passant = f"{chr(97 + self.en_passant_target[0])}{self.en_passant_target[1] + 1}"
+        
+        fen = (f"{'/'.join(ranks)} {self.active_color.value} {castling} {en_passant} "
+               f"{self.halfmove_clock} {self.fullmove_number}")
+        self._fen_cache = (key, fen)
+        return fen
     
     def set_from_fen(self, fen: str) -> None:
         """
@@ -224,9 +614,62 @@ class ChessState:
         
         Args:
             fen: Forsyth-Edwards Notation string
+            
+        Raises:
+            ValueError: If the FEN string is malformed
         """
-        # This is a placeholder - full FEN parsing would be implemented
-        pass
+        fields = fen.split()
+        if len(fields) < 4:
+            raise ValueError(f"Invalid FEN: {fen}")
+        placement, active_color, castling, en_passant = fields[:4]
+        
+        types_by_char = {piece_type.value: piece_type for piece_type in PIECE_TYPE_ORDER}
+        board: Dict[Tuple[int, int], ChessPiece] = {}
+        ranks = placement.split("/")
+        if len(ranks) != 8:
+            raise ValueError(f"Invalid FEN piece placement: {placement}")
+        for rank_index, rank in enumerate(ranks):
+            y = 7 - rank_index
+            x = 0
+            for char in rank:
+                if char.isdigit():
+                    x += int(char)
+                elif char.lower() in types_by_char and x < 8:
+                    color = PieceColor.WHITE if char.isupper() else PieceColor.BLACK
+                    board[(x, y)] = ChessPiece(types_by_char[char.lower()], color)
+                    x += 1
+                else:
+                    raise ValueError(f"Invalid FEN piece placement: {placement}")
+            if x != 8:
+                raise ValueError(f"Invalid FEN piece placement: {placement}")
+        
+        if active_color not in ("w", "b"):
+            raise ValueError(f"Invalid FEN active color: {active_color}")
+        
+        self.board = board
+        self.squares = array('b', bytes(64))
+        self.bitboards = [0] * 12
+        for (x, y), piece in board.items():
+            self.squares[y * 8 + x] = piece.code
+            self.bitboards[piece.index] |= 1 << (y * 8 + x)
+        
+        self.active_color = PieceColor(active_color)
+        self.castling_rights = {
+            PieceColor.WHITE: ("Q" in castling, "K" in castling),
+            PieceColor.BLACK: ("q" in castling, "k" in castling),
+        }
+        if en_passant == "-":
+            self.en_passant_target = None
+        else:
+            self.en_passant_target = (ord(en_passant[0]) - ord('a'), int(en_passant[1]) - 1)
+        self.halfmove_clock = int(fields[4]) if len(fields) > 4 else 0
+        self.fullmove_number = int(fields[5]) if len(fields) > 5 else 1
+        
+        self.move_history = []
+        self.zobrist = self.compute_zobrist()
+        self.phase_material = self.compute_phase_material()
+        self._legal_cache = None
+        self._fen_cache = None
 
     def get_legal_moves(self) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """
@@ -235,9 +678,7 @@ class ChessState:
         Returns:
             List of legal moves as ((from_x, from_y), (to_x, to_y)) tuples
         """
-        # This is a placeholder - a complete implementation would generate
-        # all legal moves according to chess rules
-        return []
+        return list(self._legal_move_info()[0])
     
     def algebraic_to_coords(self, algebraic: str) -> Tuple[int, int, int, int]:
         """
@@ -211,6 +211,9 @@ class StockfishAdapter:
         # Set personality traits
         self.set_personality(personality)
         
+        # Optional cap on the search depth, kept across rating changes (see set_max_depth)
+        self.max_depth: Optional[int] = None
+        
         # Set default ELO rating
         self.set_elo_rating(default_rating)
         
@@ -257,24 +260,25 @@ class StockfishAdapter:
         if elo <= 1000:
             skill_range = self.SKILL_RANGES['beginner']
             # Also reduce depth for very low ratings
-            self.stockfish.set_depth(2)
+            self.search_depth = 2
             self.make_blunders = True
             self.blunder_probability = 0.25  # 25% chance of blunders
         elif elo <= 1600:
             skill_range = self.SKILL_RANGES['intermediate']
-            self.stockfish.set_depth(10)
+            self.search_depth = 10
             self.make_blunders = True
             self.blunder_probability = 0.1  # 10% chance of blunders
         elif elo <= 2000:
             skill_range = self.SKILL_RANGES['advanced']
-            self.stockfish.set_depth(14)
+            self.search_depth = 14
             self.make_blunders = True
             self.blunder_probability = 0.05  # 5% chance of blunders
         else:
             skill_range = self.SKILL_RANGES['expert']
-            self.stockfish.set_depth(18)
+            self.search_depth = 18
             self.make_blunders = False
             self.blunder_probability = 0.0
+        self._apply_search_depth()
             
         # Randomize skill within the appropriate range
         skill_min, skill_max = skill_range
@@ -286,6 +290,23 @@ class StockfishAdapter:
         
         logger.info(f"Set ELO rating to {self.target_elo}, skill level {skill_level}")
         
+    def set_max_depth(self, max_depth: Optional[int]) -> None:
+        """
+        Cap the engine's search depth, also after later rating changes.
+        
+        Args:
+            max_depth: Maximum search depth (None to use the rating's depth)
+        """
+        self.max_depth = max_depth
+        self._apply_search_depth()
+        
+    def _apply_search_depth(self) -> None:
+        """Set the engine to the rating's search depth, within max_depth."""
+        depth = self.search_depth
+        if self.max_depth is not None:
+            depth = min(depth, self.max_depth)
+        self.stockfish.set_depth(depth)
+        
     def _load_opening_book(self, book_path: str) -> None:
         """
         Load opening book from a JSON file.
@@ -342,10 +363,12 @@ class StockfishAdapter:
         self.current_position_fen = fen
         self.move_history = moves or []
         
-        # Update Stockfish with the position
+        # Update Stockfish with the position and the moves played from it
         try:
-            self.stockfish.set_position(self.move_history)
-            logger.debug(f"Position set to: {fen}")
+            self.stockfish.set_fen_position(fen)
+            if self.move_history:
+                self.stockfish.make_moves_from_current_position(self.move_history)
+            logger.debug("Position set to: %s", fen)
         except Exception as e:
             logger.error(f"Error setting position: {e}")
             
@@ -557,7 +580,7 @@ class StockfishAdapter:
                 # Not enough options, take second best if available
                 blunder = top_moves[1]['Move'] if len(top_moves) > 1 else best_move
                 
-        logger.debug(f"Introducing blunder: {blunder} instead of {best_move}")
+        logger.debug("Introducing blunder: %s instead of %s", blunder, best_move)
         return blunder
         
     def _apply_personality_to_moves(self, top_moves: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -641,8 +664,8 @@ class StockfishAdapter:
         
         # Return the best move after personality adjustment
         if adjusted_moves:
-            logger.debug(f"Personality adjusted move: {adjusted_moves[0]['Move']} " +
-                       f"(Original: {top_moves[0]['Move']})")
+            logger.debug("Personality adjusted move: %s (Original: %s)",
+                         adjusted_moves[0]['Move'], top_moves[0]['Move'])
             return adjusted_moves[0]['Move']
         
         return top_moves[0]['Move']
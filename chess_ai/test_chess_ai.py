@@ -279,6 +279,52 @@ def test_game_commands():
     print(f"Final outcome: {status.get('outcome')}")
 
 
+def test_session_persistence():
+    """Test that active games are restored from their snapshot and move log."""
+    print_separator()
+    print("TESTING SESSION PERSISTENCE")
+    print_separator()
+    
+    # Create a test directory for game data
+    test_data_dir = os.path.join(os.path.dirname(__file__), "test_data", "persistence_test")
+    os.makedirs(test_data_dir, exist_ok=True)
+    
+    # Initialize controller
+    controller = ChessGameController(data_dir=test_data_dir)
+    
+    # Play a few moves; these are only appended to the move log, not to the snapshot
+    session_id = create_test_game(controller, difficulty=1)
+    for move in ["e2e4", "d2d4", "g1f3"]:
+        response = make_move_and_print_response(controller, session_id, move)
+        ai_response = response.get("ai_response", {})
+        if response.get("game_over", False) or ai_response.get("game_over", False):
+            break
+    
+    # A game whose move log holds a move that can't be replayed
+    broken_id = create_test_game(controller, user_id="broken_user", difficulty=1)
+    with open(os.path.join(test_data_dir, f"active_{broken_id}.moves.jsonl"), "a") as f:
+        f.write('{"move_number": 1, "player": "user", "from": [4, 1], "to": [4, 4], '
+                '"algebraic": "e2e5", "time": 0.0, "evaluation": 0, "timestamp_ns": 0}\n')
+    
+    # Reload everything from disk with a fresh controller
+    original = controller.get_game_state(session_id, include_history=True)
+    reloaded_controller = ChessGameController(data_dir=test_data_dir)
+    reloaded = reloaded_controller.get_game_state(session_id, include_history=True)
+    
+    print(f"Original FEN: {original['fen']}")
+    print(f"Reloaded FEN: {reloaded['fen']}")
+    print(f"Moves played: {original['moves_played']} -> {reloaded['moves_played']}")
+    print(f"Broken session loaded: {reloaded_controller.get_game(broken_id) is not None}")
+    print_separator()
+    
+    assert reloaded["fen"] == original["fen"], "Restored position differs"
+    assert reloaded["moves_played"] == original["moves_played"], "Restored move count differs"
+    assert ([move["algebraic"] for move in reloaded["move_history"]] ==
+            [move["algebraic"] for move in original["move_history"]]), "Restored move history differs"
+    assert all("timestamp_ns" in move for move in reloaded["move_history"]), "Move records lack timestamps"
+    assert reloaded_controller.get_game(broken_id) is None, "Session with an unplayable move log was loaded"
+
+
 def main():
     """Main test function."""
     try:
@@ -291,6 +337,7 @@ def main():
         test_intermediate_game()
         test_error_handling()
         test_game_commands()
+        test_session_persistence()
         
         print("\n" + "*" * 80)
         print("*" + " " * 24 + "ALL TESTS COMPLETED SUCCESSFULLY" + " " * 24 + "*")
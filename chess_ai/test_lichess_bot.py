@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for Eve's Lichess bot.
+
+This script tests the parts of the Lichess bot that don't need a
+connection to Lichess, such as converting python-chess positions.
+"""
+
+import sys
+import os
+import logging
+import chess
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from ai.game_ai.chess_ai.lichess_bot import LichessBot
+from ai.game_ai.chess_ai.state_manager import ChessState
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("lichess_bot_test")
+
+
+def print_separator(title: str = None):
+    """Print a separator with optional title."""
+    print("\n" + "=" * 80)
+    if title:
+        print(title.center(80))
+        print("=" * 80)
+    print()
+
+
+def test_position_conversion():
+    """Test converting python-chess boards to ChessState."""
+    print_separator("TESTING POSITION CONVERSION")
+    
+    # No requests are made, so any token will do
+    bot = LichessBot(token="test-token")
+    
+    test_positions = [
+        # Starting position
+        chess.STARTING_FEN,
+        # Partial castling rights on both sides
+        "r3k2r/pppq1ppp/2n2n2/3pp3/3PP3/2N2N2/PPPQ1PPP/R3K2R w Kq - 4 8",
+        # En passant square with white to move
+        "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3",
+        # En passant square with black to move
+        "rnbqkbnr/pppp1ppp/8/8/3Pp3/8/PPP1PPPP/RNBQKBNR b KQkq d3 0 2",
+        # Endgame without castling rights
+        "8/5k2/3p4/1p1Pp2p/pP2Pp1P/P4P1K/8/8 b - - 99 50"
+    ]
+    
+    for fen in test_positions:
+        converted = bot._convert_to_chess_state(chess.Board(fen))
+        expected = ChessState()
+        expected.set_from_fen(fen)
+        
+        print(f"FEN:       {fen}")
+        print(f"Converted: {converted.get_fen()}")
+        print()
+        
+        assert converted.get_fen() == expected.get_fen() == fen, "Converted position differs"
+        assert converted.zobrist == converted.compute_zobrist() == expected.compute_zobrist(), \
+            "Converted position hash differs"
+        assert converted.phase_material == expected.phase_material, "Converted phase material differs"
+        assert list(converted.bitboards) == list(expected.bitboards), "Converted bitboards differ"
+        assert list(converted.squares) == list(expected.squares), "Converted squares differ"
+
+
+def main():
+    """Main test function."""
+    try:
+        print("\n" + "*" * 80)
+        print("*" + " " * 31 + "LICHESS BOT TESTS" + " " * 30 + "*")
+        print("*" * 80 + "\n")
+        
+        # Run the individual tests
+        test_position_conversion()
+        
+        print("\n" + "*" * 80)
+        print("*" + " " * 24 + "ALL LICHESS BOT TESTS COMPLETED" + " " * 23 + "*")
+        print("*" * 80 + "\n")
+        
+        return 0
+        
+    except Exception as e:
+        logger.error(f"Test failed with error: {e}", exc_info=True)
+        print(f"\nERROR: Test failed with error: {e}")
+        print("\n" + "*" * 80)
+        print("*" + " " * 32 + "TEST FAILED" + " " * 32 + "*")
+        print("*" * 80 + "\n")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""
+Zobrist hashing module.
+
+This module provides the random keys used to hash chess positions into a
+single integer, so that identical positions can be recognized and cached
+cheaply (e.g. in the AI's transposition table).
+"""
+
+import random
+
+
+# Fixed seed so that position hashes are stable across runs
+_rng = random.Random(0x5EEDC0FFEE)
+
+# Keys are 63 bits wide so that hashes fit in a signed 64-bit integer
+# (e.g. the AI's numpy-based transposition table)
+KEY_BITS = 63
+
+# One key per (piece, square) pair
+# Pieces are indexed 0-11 (white pawn..king, then black pawn..king),
+# squares are indexed y * 8 + x with (0, 0) being a1
+PIECE_SQUARE = [[_rng.getrandbits(KEY_BITS) for _ in range(64)] for _ in range(12)]
+
+# XORed into the hash when black is to move
+SIDE = _rng.getrandbits(KEY_BITS)
+
+# One key per castling-rights bitmask
+# (bit 0: white kingside, bit 1: white queenside, bit 2: black kingside, bit 3: black queenside)
+CASTLE = [_rng.getrandbits(KEY_BITS) for _ in range(16)]
+
+# One key per en passant file
+EP_FILE = [_rng.getrandbits(KEY_BITS) for _ in range(8)]